@@ -0,0 +1,30 @@
+"""allow use_gov_uk_search_decision rows without an LLM response
+
+Revision ID: 5e0c2b7d94a1
+Revises: 8975d7eaf4f9
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0c2b7d94a1"
+down_revision: Union[str, None] = "8975d7eaf4f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Decisions made without calling the LLM, such as explicit requests to search GOV.UK, have no LLM response
+    op.alter_column("use_gov_uk_search_decision", "llm_internal_response_id", existing_type=sa.INTEGER(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM use_gov_uk_search_decision WHERE llm_internal_response_id IS NULL")
+    op.alter_column(
+        "use_gov_uk_search_decision", "llm_internal_response_id", existing_type=sa.INTEGER(), nullable=False
+    )
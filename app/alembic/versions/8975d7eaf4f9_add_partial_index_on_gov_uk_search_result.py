@@ -0,0 +1,30 @@
+"""add partial index on gov_uk_search_result message_id for used results
+
+Revision ID: 8975d7eaf4f9
+Revises: c7e2a91d5b38
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8975d7eaf4f9"
+down_revision: Union[str, None] = "c7e2a91d5b38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create partial index on message_id WHERE is_used
+    # Optimizes fetching the GOV.UK pages already used in a conversation, which otherwise scans every stored page
+    op.execute(
+        "CREATE INDEX idx_gov_uk_search_result_message_id_used ON gov_uk_search_result(message_id) WHERE is_used"
+    )
+
+
+def downgrade() -> None:
+    # Drop the partial index
+    op.drop_index("idx_gov_uk_search_result_message_id_used", table_name="gov_uk_search_result")
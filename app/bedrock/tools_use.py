@@ -140,6 +140,48 @@ DOCUMENT_RELEVANCE_ASSESSMENT = {
                     }
                 },
                 "required": ["is_relevant"],
+                "additionalProperties": False,
+            },
+        }
+    ]
+}
+
+BATCH_DOCUMENT_RELEVANCE_ASSESSMENT = {
+    "tools": [
+        {
+            "name": "assess_documents_relevance",
+            "description": """
+                This tool assesses the relevancy of several documents to the given query.
+                I would like you analyse the title and content of each numbered document. For every document,
+                answer 'True' if it is highly relevant to the query I am going to give you below; otherwise
+                answer 'False'. Assess each document on its own, not in comparison with the others.
+
+                Be very strict with your assessment. In particular, pay attention to the title of the Gov UK page.
+                Discard any pages that are clearly login pages,or pages that only exist to let you download document.
+                """,
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "assessments": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "index": {
+                                    "type": "integer",
+                                    "description": "The index attribute of the retrieved page being assessed",
+                                },
+                                "is_relevant": {
+                                    "type": "boolean",
+                                },
+                            },
+                            "required": ["index", "is_relevant"],
+                            "additionalProperties": False,
+                        },
+                    }
+                },
+                "required": ["assessments"],
+                "additionalProperties": False,
             },
         }
     ]
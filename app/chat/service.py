@@ -55,7 +55,7 @@ from app.chat.schemas import (
     UserDocumentSource,
 )
 from app.chat.utils import prepare_message_objects_for_llm
-from app.compaction.service import trigger_compaction_if_needed
+from app.compaction.service import apply_summaries_to_messages, trigger_compaction_if_needed
 from app.config import (
     CHAT_THINKING_LEVEL,
     LLM_CHAT_RESPONSE_MODEL,
@@ -105,7 +105,7 @@ def chat_user_group_mapping(message: Message, user_group_ids: list[int]):
         user_group_mapping_table.create({"message_id": message.id, "user_group_id": user_group_id})
 
 
-def chat_stream_message(chat: Chat, message_uuid: str, content: str, citations: str, sources: Sources) -> Dict:
+def chat_stream_message(chat: Chat, message_uuid: str, content: str, citations: str, sources_json: str) -> Dict:
     response = {
         **chat.client_response(),
         "message_streamed": {
@@ -113,7 +113,7 @@ def chat_stream_message(chat: Chat, message_uuid: str, content: str, citations:
             "role": RoleEnum.assistant,
             "content": content,
             "citations": citations,
-            "sources": sources.model_dump_json(exclude_none=True),
+            "sources": sources_json,
         },
     }
 
@@ -1015,22 +1015,24 @@ async def chat_create_message(chat: Chat, input_data: ChatCreateMessageInput, db
     query_enhanced_with_rag = "\n\n".join(query_parts)
 
     # Check if compaction is needed before generating the final message
-    compaction_triggered = False
     try:
-        compaction_triggered = await trigger_compaction_if_needed(chat_id, query_enhanced_with_rag, db_session)
-        if compaction_triggered:
+        compaction_summaries = await trigger_compaction_if_needed(chat_id, query_enhanced_with_rag, db_session)
+        if compaction_summaries is not None:
             logger.info(f"Compaction triggered for chat {chat_id} before message generation")
-            # Reload messages from database to get updated summaries
-            messages = message_repo.get_by_chat(chat_id)
+            # Only summaries changed, so merge them into the loaded messages instead of reloading the chat
+            apply_summaries_to_messages(messages, compaction_summaries)
     except Exception as e:
         logger.exception(f"Error during compaction check for chat {chat_id}: {e}")
 
+    # Sources are final at this point, so serialise them once for the database and every streamed chunk
+    sources_json = sources.model_dump_json(exclude_none=True)
+
     m_user = message_repo.update(
         m_user,
         {
             "content_enhanced_with_rag": query_enhanced_with_rag,
             "citation": json.dumps(citations),
-            "sources": sources.model_dump_json(exclude_none=True),
+            "sources": sources_json,
         },
     )
 
@@ -1059,7 +1061,7 @@ async def chat_create_message(chat: Chat, input_data: ChatCreateMessageInput, db
                 message_uuid=ai_message.uuid,
                 content=text,
                 citations=citations,
-                sources=sources,
+                sources_json=sources_json,
             )
 
         def on_error(ex: Exception):
@@ -3,9 +3,9 @@
 
 import asyncio
 import logging
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.bedrock import BedrockHandler, BedrockMessage, RunMode
@@ -173,7 +173,7 @@ async def should_trigger_compaction(chat_id: int, current_message_content: str,
     return should_compact
 
 
-async def compact_chat_messages(chat_id: int, db_session: AsyncSession) -> int:
+async def compact_chat_messages(chat_id: int, db_session: AsyncSession) -> Dict[int, str]:
     """
     Compact all unsummarised messages in a chat by creating summaries.
 
@@ -182,7 +182,7 @@ async def compact_chat_messages(chat_id: int, db_session: AsyncSession) -> int:
         db_session: Database session
 
     Returns:
-        Number of messages that were successfully summarised
+        Mapping of message ID to the new summary for each message that was successfully summarised
     """
     try:
         # Get all messages that don't have summaries yet
@@ -201,26 +201,44 @@ async def compact_chat_messages(chat_id: int, db_session: AsyncSession) -> int:
 
         llm_responses = await asyncio.gather(*summarisation_tasks, return_exceptions=True)
 
-        # Count successful summarisations
-        summarised_count = sum(
-            1 for response in llm_responses if response is not None and not isinstance(response, Exception)
-        )
+        # Collect the summaries of successful summarisations so callers can update in-memory messages
+        summaries = {
+            message.id: response.content[0].text if response.content else ""
+            for message, response in zip(messages_to_summarise, llm_responses, strict=True)
+            if response is not None and not isinstance(response, Exception)
+        }
 
         # Commit the changes
         await db_session.commit()
 
-        logger.info(f"Compaction completed for chat {chat_id}: {summarised_count} messages summarised")
-        return summarised_count
+        logger.info(f"Compaction completed for chat {chat_id}: {len(summaries)} messages summarised")
+        return summaries
 
     except Exception as e:
         logger.exception(f"Error during compaction for chat {chat_id}: {e}")
         await db_session.rollback()
-        return 0
+        return {}
+
+
+async def try_acquire_compaction_lock(chat_id: int, db_session: AsyncSession) -> bool:
+    """
+    Try to take a transaction-scoped Postgres advisory lock for compacting a chat.
+    The lock is released automatically when the transaction commits or rolls back.
+
+    Args:
+        chat_id: The chat ID to lock
+        db_session: Database session
+
+    Returns:
+        True if the lock was acquired, False if another transaction is already compacting the chat
+    """
+    result = await db_session.execute(select(func.pg_try_advisory_xact_lock(chat_id)))
+    return bool(result.scalar())
 
 
 async def perform_chat_compaction(
     chat_id: int, current_message_content: str, db_session: AsyncSession
-) -> Tuple[bool, int]:
+) -> Tuple[bool, Dict[int, str]]:
     """
     Perform chat compaction by summarising messages.
 
@@ -230,23 +248,30 @@ async def perform_chat_compaction(
         db_session: Database session
 
     Returns:
-        Tuple of (compaction_performed, messages_summarised)
+        Tuple of (compaction_performed, summaries keyed by message ID)
     """
     try:
         if not await should_trigger_compaction(chat_id, current_message_content, db_session):
-            return False, 0
+            return False, {}
+
+        # Stop concurrent turns on the same chat from summarising the same messages twice
+        if not await try_acquire_compaction_lock(chat_id, db_session):
+            logger.info(f"Compaction already in progress for chat {chat_id}, skipping")
+            return False, {}
 
         # Summarise all unsummarised messages
-        summarised_count = await compact_chat_messages(chat_id, db_session)
+        summaries = await compact_chat_messages(chat_id, db_session)
 
-        return True, summarised_count
+        return True, summaries
 
     except Exception as e:
         logger.exception(f"Error in perform_chat_compaction for chat {chat_id}: {e}")
-        return False, 0
+        return False, {}
 
 
-async def trigger_compaction_if_needed(chat_id: int, current_message_content: str, db_session: AsyncSession) -> bool:
+async def trigger_compaction_if_needed(
+    chat_id: int, current_message_content: str, db_session: AsyncSession
+) -> Optional[Dict[int, str]]:
     """
     Check if compaction is needed and trigger it if necessary.
     This is the main entry point for compaction logic.
@@ -257,14 +282,26 @@ async def trigger_compaction_if_needed(chat_id: int, current_message_content: st
         db_session: Database session
 
     Returns:
-        True if compaction was triggered and completed, False otherwise
+        The new summaries keyed by message ID if compaction was triggered and completed, None otherwise
     """
     try:
-        compaction_performed, summarised_count = await perform_chat_compaction(
-            chat_id, current_message_content, db_session
-        )
-        return compaction_performed
+        compaction_performed, summaries = await perform_chat_compaction(chat_id, current_message_content, db_session)
+        return summaries if compaction_performed else None
 
     except Exception as e:
         logger.exception(f"Error in trigger_compaction_if_needed for chat {chat_id}: {e}")
-        return False
+        return None
+
+
+def apply_summaries_to_messages(messages: list[Message], summaries: Dict[int, str]) -> None:
+    """
+    Merge summaries produced by compaction into already-loaded messages, avoiding a reload of the whole chat.
+
+    Args:
+        messages: The in-memory messages for the chat
+        summaries: The new summaries keyed by message ID
+    """
+    for message in messages:
+        summary = summaries.get(message.id)
+        if summary is not None:
+            message.summary = summary
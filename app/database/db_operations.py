@@ -1631,6 +1631,33 @@ class DbOperations:
 
         return gov_uk_search_query_result
 
+    @staticmethod
+    async def insert_gov_uk_search_queries(
+        db_session: AsyncSession,
+        llm_internal_response_id: int,
+        message_id: int,
+        queries: List[str],
+    ) -> List[GovUkSearchQuery]:
+        """
+        INSERT several GOV UK search queries in one statement.
+
+        Returns:
+            The inserted rows, in the same order as queries
+        """
+        if not queries:
+            return []
+
+        stmt = insert(GovUkSearchQuery).returning(GovUkSearchQuery, sort_by_parameter_order=True)
+        response = await db_session.scalars(
+            stmt,
+            [
+                {"llm_internal_response_id": llm_internal_response_id, "message_id": message_id, "content": query}
+                for query in queries
+            ],
+        )
+
+        return list(response.all())
+
     @staticmethod
     async def insert_gov_uk_search_result(
         db_session: AsyncSession,
@@ -1660,6 +1687,18 @@ class DbOperations:
 
         return gov_uk_search_result
 
+    @staticmethod
+    async def insert_gov_uk_search_results(db_session: AsyncSession, search_results: List[Mapping[str, Any]]) -> None:
+        """
+        INSERT several GOV UK search results in one statement.
+
+        Args:
+            search_results: Column values for each row, keyed by llm_internal_response_id, message_id,
+                gov_uk_search_query_id, url, content, is_used and position
+        """
+        if search_results:
+            await db_session.execute(insert(GovUkSearchResult), search_results)
+
     @staticmethod
     async def get_expired_chunks_for_cleanup(db_session: AsyncSession) -> List[Tuple[int, int, str]]:
         """
@@ -395,6 +395,7 @@ class DocumentChunk(Base):
         String(255),
         nullable=False,
     )  # This is not an ID anywhere in the PostgreSQL database, but it is the id in the opensearch index.
+    document = relationship("Document")
 
     def __str__(self):
         return f"name=('{self.name}'), content_truncated=('{self.content[0:20]}...{self.content[-20]}')"
@@ -540,7 +541,7 @@ class GovUkSearchQuery(Base):
 class UseGovUkSearchDecision(Base):
     __tablename__ = "use_gov_uk_search_decision"
 
-    llm_internal_response_id = Column(Integer, ForeignKey("llm_internal_response.id"), nullable=False)
+    llm_internal_response_id = Column(Integer, ForeignKey("llm_internal_response.id"), nullable=True)
     message_id = Column(Integer, ForeignKey("message.id"))
     decision = Column(Boolean, nullable=False)
 
@@ -1,10 +1,12 @@
 # ruff: noqa: A002
 import logging
+import threading
 import uuid
 from contextlib import asynccontextmanager, contextmanager
 from datetime import UTC, datetime
 from typing import Any, Generic, Optional, TypeVar
 
+from cachetools import TTLCache
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -671,13 +673,27 @@ class MessageUserGroupMappingTable(Table):
         super().__init__(model=MessageUserGroupMapping, table_name="MessageUserGroupMapping")
 
 
+_LLM_BY_MODEL_CACHE: TTLCache = TTLCache(maxsize=64, ttl=300)
+"""
+LLM records keyed by model name, kept for five minutes, so the synchronous lookup made before each LLM call
+does not query the database every time. The records are detached from their session and must not be modified.
+"""
+
+_LLM_BY_MODEL_CACHE_LOCK = threading.Lock()
+
+
 class LLMTable(Table):
     def __init__(self):
         super().__init__(model=LLM, table_name="LLM")
 
     def get_by_model(self, model: str) -> T | None:
+        with _LLM_BY_MODEL_CACHE_LOCK:
+            llm = _LLM_BY_MODEL_CACHE.get(model)
+        if llm is not None:
+            return llm
+
         try:
-            return self.get_one_by("model", model)
+            llm = self.get_one_by("model", model)
         except Exception as e:
             raise DatabaseError(
                 code=DatabaseExceptionErrorCode.GET_ONE_BY_ERROR,
@@ -685,6 +701,10 @@ class LLMTable(Table):
                 + f"Original error: {e}",
             ) from e
 
+        with _LLM_BY_MODEL_CACHE_LOCK:
+            _LLM_BY_MODEL_CACHE[model] = llm
+        return llm
+
 
 class RedactionTable(Table):
     def __init__(self):
@@ -1,5 +1,9 @@
 import logging
-from typing import Dict, List
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from operator import attrgetter
+from typing import Dict, List, Tuple
 
 from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -36,6 +40,45 @@ Gives an upper bound of the number of chunks to retrieve from OpenSearch based o
 the character limit and a lower-than-median estimate of the number of characters per chunk.
 """
 
+SEARCH_SOURCE_FIELDS = ["document_uuid", "chunk_content"]
+"""
+The only `_source` fields read from searched chunks, so OpenSearch does not send the rest back.
+"""
+
+
+class ChunkScore:
+    """
+    The relevance score of a searched chunk, consolidated across all the rewritten queries that returned it.
+    """
+
+    __slots__ = (
+        "chunk_id",
+        "chunk_data",
+        "document_uuid",
+        "total_score",
+        "query_count",
+        "final_score",
+        "character_count",
+    )
+
+    def __init__(
+        self,
+        chunk_id: str,
+        chunk_data: Dict,
+        document_uuid: str,
+        total_score: float,
+        query_count: int,
+        final_score: float,
+        character_count: int,
+    ):
+        self.chunk_id = chunk_id
+        self.chunk_data = chunk_data
+        self.document_uuid = document_uuid
+        self.total_score = total_score
+        self.query_count = query_count
+        self.final_score = final_score
+        self.character_count = character_count
+
 
 async def _get_rewritten_queries(
     query: str,
@@ -64,10 +107,10 @@ async def _get_rewritten_queries(
 
 
 async def _apply_fair_document_distribution(
-    chunk_scores: Dict[str, Dict],
+    chunk_scores: Dict[str, ChunkScore],
     document_uuids: List[str],
     character_limit: int,
-) -> List[Dict]:
+) -> Tuple[List[Dict], int]:
     """
     Applies fair document distribution to ensure smaller documents get representation
     while still allowing larger, more relevant documents to be over-represented.
@@ -78,37 +121,39 @@ async def _apply_fair_document_distribution(
     3. Reallocate unused capacity based on relevance scores
 
     Args:
-        chunk_scores: Dictionary mapping chunk_id to chunk info with scores
+        chunk_scores: Dictionary mapping chunk_id to its consolidated ChunkScore
         document_uuids: List of document UUIDs being processed
         character_limit: Maximum characters allowed
 
     Returns:
-        List of selected chunks respecting fair distribution
+        Tuple of the selected chunks respecting fair distribution and their total character count
     """
     if not chunk_scores or not document_uuids:
-        return []
+        return [], 0
+
+    document_uuids_set = set(document_uuids)
 
     # Group chunks by document
     doc_chunks = {}  # document_uuid -> list of chunk_info
     doc_total_chars = {}  # document_uuid -> total available characters
 
     for chunk_info in chunk_scores.values():
-        doc_uuid = chunk_info["chunk_data"].get("_source", {}).get("document_uuid")
-        if doc_uuid in document_uuids:
+        doc_uuid = chunk_info.document_uuid
+        if doc_uuid in document_uuids_set:
             if doc_uuid not in doc_chunks:
                 doc_chunks[doc_uuid] = []
                 doc_total_chars[doc_uuid] = 0
             doc_chunks[doc_uuid].append(chunk_info)
-            doc_total_chars[doc_uuid] += chunk_info["character_count"]
+            doc_total_chars[doc_uuid] += chunk_info.character_count
 
     # Sort chunks within each document by relevance score
     for doc_uuid in doc_chunks:
-        doc_chunks[doc_uuid].sort(key=lambda x: x["final_score"], reverse=True)
+        doc_chunks[doc_uuid].sort(key=attrgetter("final_score"), reverse=True)
 
     # Calculate fair allocation
     num_docs = len(doc_chunks)
     if num_docs == 0:
-        return []
+        return [], 0
 
     # Minimum allocation per document: 10% of total limit divided by number of docs, but at least 2000 chars
     min_allocation_per_doc = max(2000, int(character_limit * 0.1 / num_docs))
@@ -133,18 +178,18 @@ async def _apply_fair_document_distribution(
     selected_chunks = []
     doc_allocations = {}  # document_uuid -> allocated characters
     doc_used_chars = {}  # document_uuid -> actually used characters
+    doc_unselected_chunks = {}  # document_uuid -> chunks not selected yet, highest score first
 
-    for doc_uuid in doc_chunks:
+    for doc_uuid, chunks in doc_chunks.items():
         doc_allocations[doc_uuid] = min_allocation_per_doc
-        doc_used_chars[doc_uuid] = 0
 
-        # Add chunks up to minimum allocation
-        for chunk_info in doc_chunks[doc_uuid]:
-            if doc_used_chars[doc_uuid] + chunk_info["character_count"] <= min_allocation_per_doc:
-                selected_chunks.append(chunk_info["chunk_data"])
-                doc_used_chars[doc_uuid] += chunk_info["character_count"]
-            else:
-                break
+        # Add the highest scoring chunks up to the minimum allocation: the cut-off is the first point
+        # where the running character total exceeds the allocation
+        cumulative_chars = list(accumulate(chunk_info.character_count for chunk_info in chunks))
+        cutoff = bisect_right(cumulative_chars, min_allocation_per_doc)
+        selected_chunks.extend(chunk_info.chunk_data for chunk_info in chunks[:cutoff])
+        doc_used_chars[doc_uuid] = cumulative_chars[cutoff - 1] if cutoff else 0
+        doc_unselected_chunks[doc_uuid] = chunks[cutoff:]
 
     # Phase 2: Distribute remaining capacity proportionally based on document size and relevance
     if remaining_capacity > 0:
@@ -158,55 +203,48 @@ async def _apply_fair_document_distribution(
                 additional_allocation = int(remaining_capacity * proportion)
                 doc_allocations[doc_uuid] += additional_allocation
 
-        # Add more chunks up to the new allocations
+        # Add more chunks up to the new allocations, only visiting chunks not selected in phase 1
         for doc_uuid in doc_chunks:
             target_chars = doc_allocations[doc_uuid]
+            still_unselected = []
 
-            for chunk_info in doc_chunks[doc_uuid]:
-                # Skip chunks already selected
-                if chunk_info["chunk_data"] in selected_chunks:
-                    continue
+            for chunk_info in doc_unselected_chunks[doc_uuid]:
+                if doc_used_chars[doc_uuid] + chunk_info.character_count <= target_chars:
+                    selected_chunks.append(chunk_info.chunk_data)
+                    doc_used_chars[doc_uuid] += chunk_info.character_count
+                else:
+                    still_unselected.append(chunk_info)
 
-                if doc_used_chars[doc_uuid] + chunk_info["character_count"] <= target_chars:
-                    selected_chunks.append(chunk_info["chunk_data"])
-                    doc_used_chars[doc_uuid] += chunk_info["character_count"]
+            doc_unselected_chunks[doc_uuid] = still_unselected
 
     # Phase 3: Fill remaining space with highest scoring chunks across all documents
     total_used = sum(doc_used_chars.values())
     if total_used < character_limit:
         # Get all remaining chunks sorted by score
-        remaining_chunks = []
-        for doc_uuid in doc_chunks:
-            for chunk_info in doc_chunks[doc_uuid]:
-                if chunk_info["chunk_data"] not in selected_chunks:
-                    remaining_chunks.append(chunk_info)
-
-        remaining_chunks.sort(key=lambda x: x["final_score"], reverse=True)
+        remaining_chunks = [chunk_info for chunks in doc_unselected_chunks.values() for chunk_info in chunks]
+        remaining_chunks.sort(key=attrgetter("final_score"), reverse=True)
 
         # Add highest scoring chunks until we hit the limit
         for chunk_info in remaining_chunks:
-            if total_used + chunk_info["character_count"] <= character_limit:
-                selected_chunks.append(chunk_info["chunk_data"])
-                total_used += chunk_info["character_count"]
-                doc_used_chars[chunk_info["chunk_data"].get("_source", {}).get("document_uuid")] += chunk_info[
-                    "character_count"
-                ]
+            if total_used + chunk_info.character_count <= character_limit:
+                selected_chunks.append(chunk_info.chunk_data)
+                total_used += chunk_info.character_count
+                doc_used_chars[chunk_info.document_uuid] += chunk_info.character_count
 
     # Log distribution results
+    selected_counts = Counter(chunk.get("_source", {}).get("document_uuid") for chunk in selected_chunks)
     for doc_uuid in doc_chunks:
-        num_chunks = sum(1 for chunk in selected_chunks if chunk.get("_source", {}).get("document_uuid") == doc_uuid)
         logger.info(
             "Document %s: %d chunks, %d characters (target: %d)",
             doc_uuid[:8],
-            num_chunks,
+            selected_counts[doc_uuid],
             doc_used_chars[doc_uuid],
             doc_allocations[doc_uuid],
         )
 
-    final_char_count = sum(len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in selected_chunks)
-    logger.info("Fair distribution complete: %d chunks, %d characters", len(selected_chunks), final_char_count)
+    logger.info("Fair distribution complete: %d chunks, %d characters", len(selected_chunks), total_used)
 
-    return selected_chunks
+    return selected_chunks, total_used
 
 
 async def _retrieve_relevant_chunks(
@@ -233,6 +271,9 @@ async def _retrieve_relevant_chunks(
         dictionaries.
 
     """
+    if not rag_request.document_uuids:
+        return []
+
     logger.info("starting to retrieve pdu relevant chunks with global character limit of %s", GLOBAL_CHARACTER_LIMIT)
 
     # First, get all chunks across all documents to determine total character count
@@ -242,9 +283,13 @@ async def _retrieve_relevant_chunks(
         rag_request.document_uuids,
         max_size=OPENSEARCH_CHUNK_LIMIT,
     )
+    if not all_chunks:
+        logger.info("No chunks found for documents %s", rag_request.document_uuids)
+        return []
 
     # Calculate total character count across all chunks
-    total_character_count = sum(len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in all_chunks)
+    character_counts = [len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in all_chunks]
+    total_character_count = sum(character_counts)
 
     logger.info(
         "Retrieved %s chunks (%s characters) across %s documents (limited by max_size=%s for initial check)",
@@ -263,6 +308,7 @@ async def _retrieve_relevant_chunks(
             GLOBAL_CHARACTER_LIMIT,
         )
         unique_chunks = all_chunks
+        unique_character_count = total_character_count
     else:
         # Need to search for the most relevant chunks since we exceed the character limit
         logger.info(
@@ -275,60 +321,87 @@ async def _retrieve_relevant_chunks(
         rewritten_queries = await _get_rewritten_queries(rag_request.query, search_index, message, db_session)
 
         # Search across all documents for the most relevant chunks and consolidate scores
-        chunk_scores = {}  # chunk_id -> {chunk_data, total_score, query_count, final_score, character_count}
-
-        for query in rewritten_queries:
-            # Request more chunks since we'll filter by characters
-            chunks = await AsyncOpenSearchOperations.search_multiple_document_chunks(
-                rag_request.document_uuids, query, PERSONAL_DOCUMENTS_INDEX_NAME, max_size=OPENSEARCH_CHUNK_LIMIT
-            )
+        chunk_scores: Dict[str, ChunkScore] = {}
+
+        # Run all the rewritten queries in a single multi-search round-trip
+        # Request more chunks since we'll filter by characters
+        search_results = await AsyncOpenSearchOperations.msearch_multiple_document_chunks(
+            rag_request.document_uuids,
+            rewritten_queries,
+            PERSONAL_DOCUMENTS_INDEX_NAME,
+            max_size=OPENSEARCH_CHUNK_LIMIT,
+            source_fields=SEARCH_SOURCE_FIELDS,
+        )
 
+        # Fold the per-query scores into flat totals and counts, keeping the first hit seen for each chunk,
+        # then build each chunk's record once rather than updating it on every repeat hit
+        per_query_scores = [{chunk["_id"]: chunk.get("_score", 0.0) for chunk in chunks} for chunks in search_results]
+        first_hits = {}
+        for chunks in search_results:
             for chunk in chunks:
-                chunk_id = chunk["_id"]
-                opensearch_score = chunk.get("_score", 0.0)
-                chunk_content = chunk.get("_source", {}).get("chunk_content", "")
-                character_count = len(chunk_content)
-
-                if chunk_id in chunk_scores:
-                    # Chunk appeared in multiple queries - boost its score
-                    chunk_scores[chunk_id]["total_score"] += opensearch_score
-                    chunk_scores[chunk_id]["query_count"] += 1
-                    # Apply multi-query boost: chunks appearing in multiple queries get a bonus
-                    multi_query_boost = 1.0 + (chunk_scores[chunk_id]["query_count"] - 1) * 0.2
-                    chunk_scores[chunk_id]["final_score"] = chunk_scores[chunk_id]["total_score"] * multi_query_boost
-                else:
-                    # First time seeing this chunk
-                    chunk_scores[chunk_id] = {
-                        "chunk_data": chunk,
-                        "total_score": opensearch_score,
-                        "query_count": 1,
-                        "final_score": opensearch_score,
-                        "character_count": character_count,
-                    }
+                first_hits.setdefault(chunk["_id"], chunk)
+        total_scores = dict.fromkeys(first_hits, 0.0)
+        query_counts = dict.fromkeys(first_hits, 0)
+        for query_scores in per_query_scores:
+            for chunk_id, opensearch_score in query_scores.items():
+                total_scores[chunk_id] += opensearch_score
+                query_counts[chunk_id] += 1
+
+        for chunk_id, chunk in first_hits.items():
+            chunk_source = chunk.get("_source", {})
+            # Apply multi-query boost: chunks appearing in multiple queries get a bonus
+            multi_query_boost = 1.0 + (query_counts[chunk_id] - 1) * 0.2
+            chunk_scores[chunk_id] = ChunkScore(
+                chunk_id=chunk_id,
+                chunk_data=chunk,
+                document_uuid=chunk_source.get("document_uuid"),
+                total_score=total_scores[chunk_id],
+                query_count=query_counts[chunk_id],
+                final_score=total_scores[chunk_id] * multi_query_boost,
+                character_count=len(chunk_source.get("chunk_content", "")),
+            )
 
         # Apply fair document distribution to ensure smaller documents get representation
-        unique_chunks = await _apply_fair_document_distribution(
+        unique_chunks, unique_character_count = await _apply_fair_document_distribution(
             chunk_scores, rag_request.document_uuids, GLOBAL_CHARACTER_LIMIT
         )
 
-        final_character_count = sum(len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in unique_chunks)
         logger.info(
             "Consolidated %s chunks from %s queries into %s chunks (%s characters). "
             "Chunks appearing in multiple queries: %s",
             len(chunk_scores),
             len(rewritten_queries),
             len(unique_chunks),
-            final_character_count,
-            sum(1 for item in chunk_scores.values() if item["query_count"] > 1),
+            unique_character_count,
+            sum(1 for item in chunk_scores.values() if item.query_count > 1),
         )
 
-    total_character_count_final = sum(len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in unique_chunks)
     logger.info(
-        "Retrieved %s chunks with %s total characters for user query", len(unique_chunks), total_character_count_final
+        "Retrieved %s chunks with %s total characters for user query", len(unique_chunks), unique_character_count
     )
     return unique_chunks
 
 
+_SEARCH_INDEX_CACHE: Dict[str, SearchIndex] = {}
+"""
+Search index records keyed by name. The personal documents index record is seeded at deploy time and never changes,
+so it only needs to be read from the database once per process.
+"""
+
+
+async def _get_personal_documents_search_index(session: AsyncSession) -> SearchIndex:
+    """
+    Returns the personal documents search index record, reading it from the database on first use only.
+    """
+    pdu_search_index = _SEARCH_INDEX_CACHE.get(PERSONAL_DOCUMENTS_INDEX_NAME)
+    if pdu_search_index is None:
+        execute = await session.execute(select(SearchIndex).where(SearchIndex.name == PERSONAL_DOCUMENTS_INDEX_NAME))
+        pdu_search_index = execute.scalar()
+        if pdu_search_index is not None:
+            _SEARCH_INDEX_CACHE[PERSONAL_DOCUMENTS_INDEX_NAME] = pdu_search_index
+    return pdu_search_index
+
+
 async def _message_search_index_mapping_record(message: Message) -> tuple[MessageSearchIndexMapping, SearchIndex]:
     """
     Creates a search index mapping record for the given message and retrieves the associated search index.
@@ -344,8 +417,7 @@ async def _message_search_index_mapping_record(message: Message) -> tuple[Messag
 
     """
     async with async_db_session() as session:
-        execute = await session.execute(select(SearchIndex).where(SearchIndex.name == PERSONAL_DOCUMENTS_INDEX_NAME))
-        pdu_search_index = execute.scalar()
+        pdu_search_index = await _get_personal_documents_search_index(session)
 
         # create a search index mapping record to log personal index used for the message
         stmt = (
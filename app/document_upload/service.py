@@ -1,4 +1,5 @@
 from logging import getLogger
+from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -84,19 +85,26 @@ async def compile_document_upload_prompt_segments(
     if user_retrieval_results:
         citation_message = []
         if user_retrieval_results:
-            prompt_segment_user_retrieval = "<uploaded-documents-search-results>"
+            prompt_segment_parts = ["<uploaded-documents-search-results>"]
             # user retrievals are stored in single index
             # keep a single doc citation if multiple chunks used from same document.
             user_doc_citations = {}
+            # format each chunk once, and only include it once if it was retrieved more than once
+            seen_chunks: dict[tuple[UUID, int], str] = {}
 
-            for i, retrieval_result in enumerate(user_retrieval_results):
+            for retrieval_result in user_retrieval_results:
                 document = retrieval_result.document
                 user_doc_citations[str(document.uuid)] = {"docname": document.name, "docurl": document.url}
 
                 doc_chunk = retrieval_result.document_chunk
-                result_string = format_doc_chunk_for_prompt(doc_chunk, document)
-                prompt_segment_user_retrieval += f"\n<result-{i}>\n{result_string}\n</result-{i}>"
-            prompt_segment_user_retrieval += "\n</uploaded-documents-search-results>"
+                key = (document.uuid, doc_chunk.id)
+                if key in seen_chunks:
+                    continue
+                i = len(seen_chunks)
+                seen_chunks[key] = format_doc_chunk_for_prompt(doc_chunk, document)
+                prompt_segment_parts.append(f"\n<result-{i}>\n{seen_chunks[key]}\n</result-{i}>")
+            prompt_segment_parts.append("\n</uploaded-documents-search-results>")
+            prompt_segment_user_retrieval = "".join(prompt_segment_parts)
             citation_message = citation_message + list(user_doc_citations.values())
 
         return (prompt_segment_user_retrieval, citation_message)
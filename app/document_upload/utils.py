@@ -1,12 +1,16 @@
+import asyncio
 from logging import getLogger
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from anthropic.types import ToolUseBlock
+from cachetools import TTLCache
 from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload
 
-from app.bedrock import BedrockHandler, RunMode
+from app.bedrock import BedrockHandler, BedrockMessage, RunMode
+from app.bedrock.service import calculate_completion_cost
 from app.central_guidance.constants import (
     SYSTEM_PROMPT_OPENSEARCH_QUERY_GENERATOR,
     TOOL_NAME_OPENSEARCH_QUERY_GENERATOR,
@@ -14,17 +18,108 @@ from app.central_guidance.constants import (
 )
 from app.central_guidance.schemas import RetrievalResult
 from app.config import LLM_OPENSEARCH_QUERY_GENERATOR
+from app.database.db_operations import DbOperations
 from app.database.models import (
     LLM,
-    Document,
     DocumentChunk,
     MessageDocumentChunkMapping,
     RewrittenQuery,
     SearchIndex,
 )
+from app.database.table import async_db_session
 
 logger = getLogger(__name__)
 
+_AUDIT_TASKS: Set[asyncio.Task] = set()
+"""
+Strong references to in-flight audit tasks, so the event loop does not garbage collect them before they finish.
+"""
+
+_QUERY_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+"""
+Recently rewritten queries keyed by (user message, search index id), so a resubmitted message does not
+pay for another LLM call. Each entry also holds the audit task of the LLM call that generated the queries.
+"""
+
+
+async def _insert_rewritten_queries(
+    db_session: AsyncSession,
+    search_index_id: int,
+    message_id: int,
+    llm_internal_response_id: int,
+    opensearch_queries: List[str],
+):
+    query_models = [
+        {
+            "search_index_id": search_index_id,
+            "message_id": message_id,
+            "llm_internal_response_id": llm_internal_response_id,
+            "content": rewritten_query,
+        }
+        for rewritten_query in opensearch_queries
+    ]
+    await db_session.execute(insert(RewrittenQuery), query_models)
+
+
+async def _persist_llm_audit(
+    llm: LLM, response: BedrockMessage, search_index_id: int, message_id: int, opensearch_queries: List[str]
+) -> int:
+    """
+    Records the query generator LLM call and the rewritten queries it produced in a session of its own.
+    Both rows are audit logging only, so this runs off the request path.
+
+    Returns:
+        int: The id of the recorded LLM internal response
+    """
+    async with async_db_session() as db_session:
+        llm_internal_response = await DbOperations.insert_llm_internal_response_id_query(
+            db_session=db_session,
+            web_browsing_llm=llm,
+            content=str(response.content),
+            tokens_in=response.usage.input_tokens,
+            tokens_out=response.usage.output_tokens,
+            completion_cost=calculate_completion_cost(llm, response.usage.input_tokens, response.usage.output_tokens),
+        )
+        await _insert_rewritten_queries(
+            db_session, search_index_id, message_id, llm_internal_response.id, opensearch_queries
+        )
+        return llm_internal_response.id
+
+
+async def _persist_cached_queries_audit(
+    llm_audit_task: asyncio.Task, search_index_id: int, message_id: int, opensearch_queries: List[str]
+):
+    """
+    Records rewritten queries reused from the cache against the LLM call that originally generated them.
+    """
+    llm_internal_response_id = await llm_audit_task
+    async with async_db_session() as db_session:
+        await _insert_rewritten_queries(
+            db_session, search_index_id, message_id, llm_internal_response_id, opensearch_queries
+        )
+
+
+def _on_audit_task_done(task: asyncio.Task):
+    _AUDIT_TASKS.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Failed to record rewritten queries", exc_info=task.exception())
+
+
+def _schedule_audit(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _AUDIT_TASKS.add(task)
+    task.add_done_callback(_on_audit_task_done)
+    return task
+
+
+async def wait_for_audit_tasks():
+    """
+    Waits for in-flight audit writes to finish, so they are not cut off when the database engine is disposed
+    on shutdown. Failures are already logged by each task's done callback.
+    """
+    if _AUDIT_TASKS:
+        await asyncio.gather(*_AUDIT_TASKS, return_exceptions=True)
+
 
 async def rewrite_user_query(
     user_message: str,
@@ -32,12 +127,20 @@ async def rewrite_user_query(
     message_id: int,
     db_session: AsyncSession,
 ) -> List[str]:
+    cache_key = (user_message, index.id)
+    cached = _QUERY_CACHE.get(cache_key)
+    if cached is not None:
+        opensearch_queries, llm_audit_task = cached
+        logger.info(f"Reusing recently generated OpenSearch keyword queries: {opensearch_queries}")
+        _schedule_audit(_persist_cached_queries_audit(llm_audit_task, index.id, message_id, opensearch_queries))
+        return opensearch_queries
+
     logger.info("Generating OpenSearch queries...")
     execute = await db_session.execute(select(LLM).filter(LLM.model == LLM_OPENSEARCH_QUERY_GENERATOR))
     llm = execute.scalar_one()
     bedrock_handler = BedrockHandler(llm=llm, mode=RunMode.ASYNC)
+    # The LLM call is logged by _persist_llm_audit rather than in db_session, as the rewritten queries reference it
     response = await bedrock_handler.invoke_async(
-        db_session=db_session,
         max_tokens=llm.max_tokens,
         system=SYSTEM_PROMPT_OPENSEARCH_QUERY_GENERATOR,
         messages=[{"role": "user", "content": user_message}],
@@ -50,17 +153,9 @@ async def rewrite_user_query(
             opensearch_queries = block.input["keyword_queries"]
     logger.info(f"OpenSearch keyword queries generated by LLM: {opensearch_queries}")
 
-    # Record the rewritten queries
-    query_models = [
-        {
-            "search_index_id": index.id,
-            "message_id": message_id,
-            "llm_internal_response_id": response.llm_internal_response_id,
-            "content": rewritten_query,
-        }
-        for rewritten_query in opensearch_queries
-    ]
-    await db_session.execute(insert(RewrittenQuery), query_models)
+    # Record the rewritten queries in the background so the caller can start searching straight away
+    llm_audit_task = _schedule_audit(_persist_llm_audit(llm, response, index.id, message_id, opensearch_queries))
+    _QUERY_CACHE[cache_key] = (opensearch_queries, llm_audit_task)
 
     return opensearch_queries
 
@@ -72,35 +167,56 @@ async def get_document_chunk_mappings(
     Processes a list of document chunks, creates mappings between messages and document chunks,
     and returns a list of RetrievalResult objects.
     """
-    retrieval_results = []
+    if not chunks:
+        return []
+
+    # Look up every chunk, joined to its parent document, in one query rather than querying per hit
+    ids_opensearch = [hit["_id"] for hit in chunks]
+    execute = await session.execute(
+        select(DocumentChunk)
+        .options(joinedload(DocumentChunk.document))
+        .filter(DocumentChunk.id_opensearch.in_(ids_opensearch))
+    )
+    doc_chunks_by_id_opensearch = {doc_chunk.id_opensearch: doc_chunk for doc_chunk in execute.scalars().all()}
+
+    found_chunks = []
     for hit in chunks:
         id_opensearch = hit["_id"]
         logger.debug("get_document_chunk_mappings-id_opensearch %s", id_opensearch)
 
-        execute = await session.execute(select(DocumentChunk).filter(DocumentChunk.id_opensearch == id_opensearch))
-        doc_chunk = execute.scalar_one_or_none()
+        doc_chunk = doc_chunks_by_id_opensearch.get(id_opensearch)
         if not doc_chunk:
             logger.warning(f"DocumentChunk not found for id_opensearch: {id_opensearch}")
             continue
+        found_chunks.append((hit, doc_chunk))
 
-        message_document_chunk_mapping = MessageDocumentChunkMapping(
-            message_id=message_id, document_chunk_id=doc_chunk.id, opensearch_score=hit["_score"]
-        )
-        if use_chunk is not None:
-            message_document_chunk_mapping.use_document_chunk = use_chunk
+    if not found_chunks:
+        return []
 
-        session.add(message_document_chunk_mapping)
-
-        execute = await session.execute(select(Document).filter(Document.id == doc_chunk.document_id))
-        document = execute.scalar_one()
+    # Write all the message to chunk mappings in a single INSERT
+    mapping_rows = [
+        {
+            "message_id": message_id,
+            "document_chunk_id": doc_chunk.id,
+            "opensearch_score": hit["_score"],
+            "use_document_chunk": use_chunk,
+        }
+        for hit, doc_chunk in found_chunks
+    ]
+    execute = await session.execute(
+        insert(MessageDocumentChunkMapping).returning(MessageDocumentChunkMapping, sort_by_parameter_order=True),
+        mapping_rows,
+    )
+    message_document_chunk_mappings = execute.scalars().all()
 
-        retrieval_result = RetrievalResult(
+    return [
+        RetrievalResult(
             search_index=index,
             document_chunk=doc_chunk,
-            document=document,
+            document=doc_chunk.document,
             message_document_chunk_mapping=message_document_chunk_mapping,
         )
-
-        retrieval_results.append(retrieval_result)
-
-    return retrieval_results
+        for (_, doc_chunk), message_document_chunk_mapping in zip(
+            found_chunks, message_document_chunk_mappings, strict=True
+        )
+    ]
@@ -1,5 +1,6 @@
-import bugsnag
-from fastapi import HTTPException, Request
+import logging
+
+from fastapi import Request
 from fastapi.responses import JSONResponse, Response
 
 from app.auth.exceptions import (
@@ -16,56 +17,57 @@ from app.auth.exceptions import (
 from app.bedrock.bedrock_types import BedrockError
 from app.chat.schemas import DocumentAccessError
 from app.database.database_exception import DatabaseError, DatabaseExceptionErrorCode
+from app.logs.bugsnag_logger import notify_bugsnag_in_background
 from app.logs.logs_handler import logger
 from app.personal_prompts.exceptions import UserPromptMissingError
 
 
-def log_and_raise_http_exception(status_code: int, request: Request, exc: Exception) -> None:
-    logger.error(f"Error in endpoint {request.url.path}: {exc}\n", exc_info=exc)
-    raise HTTPException(status_code=status_code, detail=str(exc))
-
-
-async def auth_token_missing_handler(request: Request, exc: AuthTokenMissingError) -> None:
-    log_and_raise_http_exception(status_code=401, request=request, exc=exc)
-
-
-def auth_token_invalid_handler(request: Request, exc: AuthTokenInvalidError) -> None:
-    log_and_raise_http_exception(status_code=401, request=request, exc=exc)
-
-
-def add_new_user_error_handler(request: Request, exc: AddNewUserError) -> None:
-    log_and_raise_http_exception(status_code=401, request=request, exc=exc)
-
-
-def session_uuid_missing_handler(request: Request, exc: SessionUuidMissingError) -> None:
-    log_and_raise_http_exception(status_code=400, request=request, exc=exc)
-
-
-def user_key_uuid_missing_handler(request: Request, exc: UserKeyUuidMissingError) -> None:
-    log_and_raise_http_exception(status_code=400, request=request, exc=exc)
-
-
-def user_uuid_not_matching_handler(request: Request, exc: UserUuidNotMatchingError) -> None:
-    log_and_raise_http_exception(status_code=403, request=request, exc=exc)
-
-
-def session_uuid_malformed_handler(request: Request, exc: SessionUuidMalformedError) -> None:
-    log_and_raise_http_exception(status_code=400, request=request, exc=exc)
-
-
-def user_key_uuid_malformed_handler(request: Request, exc: UserKeyUuidMalformedError) -> None:
-    log_and_raise_http_exception(status_code=400, request=request, exc=exc)
-
-
-def session_uuid_not_in_database_handler(request: Request, exc: SessionUuidNotInDatabaseError) -> None:
-    log_and_raise_http_exception(status_code=404, request=request, exc=exc)
-
-
-def user_prompt_missing_handler(request: Request, exc: UserPromptMissingError) -> None:
-    log_and_raise_http_exception(status_code=404, request=request, exc=exc)
+def log_and_return_error_response(status_code: int, request: Request, exc: Exception) -> Response:
+    # Return the response directly rather than raising an HTTPException from inside the handler,
+    # which would send a second exception back through the middleware stack.
+    # These are expected client errors, so the traceback is only formatted when debugging.
+    logger.error(
+        "Error in endpoint %s: %s",
+        request.url.path,
+        exc,
+        exc_info=exc if logger.isEnabledFor(logging.DEBUG) else None,
+    )
+    return JSONResponse(status_code=status_code, content={"detail": str(exc)})
+
+
+CLIENT_ERROR_STATUS_CODES: dict[type[Exception], int] = {
+    AuthTokenMissingError: 401,
+    AuthTokenInvalidError: 401,
+    AddNewUserError: 401,
+    SessionUuidMissingError: 400,
+    UserKeyUuidMissingError: 400,
+    UserUuidNotMatchingError: 403,
+    SessionUuidMalformedError: 400,
+    UserKeyUuidMalformedError: 400,
+    SessionUuidNotInDatabaseError: 404,
+    UserPromptMissingError: 404,
+}
+"""
+Client error exception types and the status code `client_error_handler` returns for each.
+"""
+
+DEFAULT_ERROR_STATUS_CODE = 500
+"""
+The status code `client_error_handler` returns for an exception that is not a client error type.
+"""
+
+
+async def client_error_handler(request: Request, exc: Exception) -> Response:
+    # Async so Starlette calls it on the event loop instead of sending it to the threadpool.
+    # Starlette also routes subclasses of the registered types here, so look the status code up along the MRO.
+    status_code = next(
+        (CLIENT_ERROR_STATUS_CODES[cls] for cls in type(exc).__mro__ if cls in CLIENT_ERROR_STATUS_CODES),
+        DEFAULT_ERROR_STATUS_CODE,
+    )
+    return log_and_return_error_response(status_code=status_code, request=request, exc=exc)
 
 
-def handle_document_access_error(request: Request, ex: DocumentAccessError) -> Response:
+async def handle_document_access_error(request: Request, ex: DocumentAccessError) -> Response:
     detail = {"error": "DOCUMENT_ACCESS_ERROR", "documents_uuids": ex.document_uuids}
     return JSONResponse(status_code=401, content=detail)
 
@@ -76,8 +78,13 @@ async def database_exception_handler(request: Request, exc: DatabaseError) -> Re
         return JSONResponse(content="Record not found", status_code=404)
     if exc.code == DatabaseExceptionErrorCode.USE_CASE_NOT_UNDER_THIS_THEME_ERROR:
         return JSONResponse(content=f"{exc.message}", status_code=404)
-    logger.error(f"Database Error: code={exc.code}, message={exc.message}")
-    bugsnag.notify(exc)
+    logger.error(
+        "Database Error: code=%s, message=%s",
+        exc.code,
+        exc.message,
+        extra={"db_error_code": exc.code.name, "db_error_message": exc.message},
+    )
+    notify_bugsnag_in_background(exc)
     return JSONResponse(content="An internal error occurred.", status_code=500)
 
 
@@ -88,18 +95,18 @@ async def bedrock_exception_handler(request: Request, exc: BedrockError) -> Resp
     )
 
 
+EXCEPTION_HANDLERS = (
+    *((exception_class, client_error_handler) for exception_class in CLIENT_ERROR_STATUS_CODES),
+    (DocumentAccessError, handle_document_access_error),
+    (DatabaseError, database_exception_handler),
+    (BedrockError, bedrock_exception_handler),
+)
+"""
+Exception types and the handler registered for each by `register_exception_handlers`.
+"""
+
+
 def register_exception_handlers(app):
     """Register all exception handlers with the FastAPI app."""
-    app.exception_handler(AuthTokenMissingError)(auth_token_missing_handler)
-    app.exception_handler(AuthTokenInvalidError)(auth_token_invalid_handler)
-    app.exception_handler(AddNewUserError)(add_new_user_error_handler)
-    app.exception_handler(SessionUuidMissingError)(session_uuid_missing_handler)
-    app.exception_handler(UserKeyUuidMissingError)(user_key_uuid_missing_handler)
-    app.exception_handler(UserUuidNotMatchingError)(user_uuid_not_matching_handler)
-    app.exception_handler(SessionUuidMalformedError)(session_uuid_malformed_handler)
-    app.exception_handler(UserKeyUuidMalformedError)(user_key_uuid_malformed_handler)
-    app.exception_handler(SessionUuidNotInDatabaseError)(session_uuid_not_in_database_handler)
-    app.exception_handler(UserPromptMissingError)(user_prompt_missing_handler)
-    app.exception_handler(DocumentAccessError)(handle_document_access_error)
-    app.exception_handler(DatabaseError)(database_exception_handler)
-    app.exception_handler(BedrockError)(bedrock_exception_handler)
+    for exception_class, handler in EXCEPTION_HANDLERS:
+        app.add_exception_handler(exception_class, handler)
@@ -2,7 +2,9 @@
 
 from typing import List
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Body, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.endpoints import ENDPOINTS
 from app.auth.verify_service import (
@@ -14,6 +16,7 @@ from app.auth.verify_service import (
 )
 from app.chat.schemas import FeedbackLabelResponse, MessageResponse
 from app.database.db_operations import DbOperations
+from app.database.db_session import get_db_session
 from app.database.table import (
     async_db_session,
 )
@@ -24,20 +27,35 @@ from app.feedback.feedback_methods import (
 
 router = APIRouter()
 
+_FEEDBACK_LABELS_CACHE: TTLCache = TTLCache(maxsize=1, ttl=3600)
+"""
+The feedback label list, kept for an hour. Labels are reference data that only change through migrations.
+"""
 
-async def message_validator(message_uuid: str) -> MessageResponse:
+_MESSAGE_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=60)
+"""
+Recently validated messages keyed by UUID, as client response data, so repeated feedback on the same message
+does not look it up again. The feedback itself is still processed against the message read from the database.
+"""
+
+
+async def message_validator(message_uuid: str, db_session: AsyncSession = Depends(get_db_session)) -> MessageResponse:
     message_uuid = verify_and_parse_uuid(message_uuid)
 
-    async with async_db_session() as db_session:
+    message_data = _MESSAGE_RESPONSE_CACHE.get(message_uuid)
+    if message_data is None:
         message = await DbOperations.get_message_by_uuid(db_session=db_session, message_uuid=message_uuid)
 
-    if not message:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"No message found with UUID '{message_uuid}'",
-        )
+        if not message:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"No message found with UUID '{message_uuid}'",
+            )
+
+        message_data = message.client_response()
+        _MESSAGE_RESPONSE_CACHE[message_uuid] = message_data
 
-    return MessageResponse(**message.client_response())
+    return MessageResponse(**message_data)
 
 
 @router.get(
@@ -49,9 +67,13 @@ async def message_validator(message_uuid: str) -> MessageResponse:
     ],
 )
 async def message_feedback_labels() -> List[FeedbackLabelResponse]:
-    async with async_db_session() as db_session:
-        labels = await DbOperations.get_message_feedback_labels_list(db_session=db_session)
-        return [FeedbackLabelResponse(**label.client_response()) for label in labels]
+    feedback_labels = _FEEDBACK_LABELS_CACHE.get("labels")
+    if feedback_labels is None:
+        async with async_db_session() as db_session:
+            labels = await DbOperations.get_message_feedback_labels_list(db_session=db_session)
+            feedback_labels = [FeedbackLabelResponse(**label.client_response()) for label in labels]
+        _FEEDBACK_LABELS_CACHE["labels"] = feedback_labels
+    return feedback_labels
 
 
 @router.put(
@@ -62,6 +84,10 @@ async def message_feedback_labels() -> List[FeedbackLabelResponse]:
         Depends(verify_and_get_auth_session_from_header),
     ],
 )
-async def add_message_feedback(message=Depends(message_validator), data: FeedbackRequest = Body(...)):
-    async with async_db_session() as db_session:
-        return await process_message_feedback(db_session=db_session, message=message, feedback_request=data)
+async def add_message_feedback(
+    message=Depends(message_validator),
+    data: FeedbackRequest = Body(...),
+    db_session: AsyncSession = Depends(get_db_session),
+):
+    # message_validator receives the same request-scoped session, so the lookup and the write share one transaction
+    return await process_message_feedback(db_session=db_session, message=message, feedback_request=data)
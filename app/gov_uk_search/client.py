@@ -1,10 +1,96 @@
+import asyncio
+import time
+from itertools import chain
+from operator import itemgetter
 from typing import Any, Dict, List, Tuple
 
 import aiohttp
+import orjson
+from cachetools import TTLCache
 
 from app.gov_uk_search.constants import CONTENT_URL
 from app.logs.logs_handler import logger
 
+BULK_CONTENT_CONCURRENCY = 20
+"""
+The maximum number of concurrent GOV UK Content API requests made by `GovUKContent.get_contents_bulk`,
+kept below the per-host connection limit of the shared session so searches can still get a connection.
+"""
+
+_CONTENT_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=300)
+"""
+Content API responses keyed by path, kept for five minutes. Only successful responses are cached.
+"""
+
+_CONTENT_IN_FLIGHT: Dict[str, asyncio.Task] = {}
+"""
+Content API requests currently in progress keyed by path, so concurrent requests for the same path share one fetch.
+"""
+
+_CONTENT_NOT_FOUND: TTLCache = TTLCache(maxsize=4096, ttl=600)
+"""
+Paths the Content API returned 404 for, kept for ten minutes so repeated lookups skip the request.
+"""
+
+_get_base_path = itemgetter("base_path")
+
+
+class GovUKHttpSession:
+    """
+    Provides a single aiohttp session for GOV UK Content and Search API requests, so connections to the API host
+    are pooled and kept alive between requests. The session is created on first use and closed on application shutdown.
+    """
+
+    _instance: aiohttp.ClientSession | None = None
+
+    @classmethod
+    def get(cls) -> aiohttp.ClientSession:
+        if cls._instance is None or cls._instance.closed:
+            cls._instance = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=20),
+            )
+        return cls._instance
+
+    @classmethod
+    async def close(cls):
+        """Close the session if it exists"""
+        if cls._instance is not None:
+            await cls._instance.close()
+            cls._instance = None
+
+
+class ContentApiCircuitBreaker:
+    """
+    Stops calling the GOV UK Content API for a while after repeated failures, so an outage fails requests
+    immediately instead of every request waiting for the timeout.
+    """
+
+    FAILURE_THRESHOLD = 5
+    """Consecutive failed requests that open the circuit."""
+
+    OPEN_SECS = 30
+    """How long the circuit stays open before requests are attempted again."""
+
+    _failures = 0
+    _open_until = 0.0
+
+    @classmethod
+    def is_open(cls) -> bool:
+        return time.monotonic() < cls._open_until
+
+    @classmethod
+    def record_success(cls):
+        cls._failures = 0
+
+    @classmethod
+    def record_failure(cls):
+        cls._failures += 1
+        if cls._failures >= cls.FAILURE_THRESHOLD:
+            logger.warning(f"GOV UK Content API failed {cls._failures} times in a row, pausing for {cls.OPEN_SECS}s")
+            cls._open_until = time.monotonic() + cls.OPEN_SECS
+            cls._failures = 0
+
 
 class GovUKContent:
     @staticmethod
@@ -16,24 +102,90 @@ class GovUKContent:
             path: The path of the content to retrieve (without leading slash)
 
         Returns:
-            Dict containing the content data
+            Dict containing the content data. Responses are cached and shared between callers, so must not be modified.
 
         Example:
             >>> await GovUKContent.get_content("help/cookies")
         """
-        url = f"{CONTENT_URL}/{path.lstrip('/')}"
+        path = path.lstrip("/")
+        content = _CONTENT_CACHE.get(path)
+        if content is not None:
+            return content
+        if path in _CONTENT_NOT_FOUND:
+            return {}
+
+        fetch_task = _CONTENT_IN_FLIGHT.get(path)
+        if fetch_task is None:
+            fetch_task = asyncio.create_task(GovUKContent._fetch_content(path))
+            _CONTENT_IN_FLIGHT[path] = fetch_task
+            fetch_task.add_done_callback(lambda _: _CONTENT_IN_FLIGHT.pop(path, None))
+
+        # shield the shared fetch so one caller being cancelled does not cancel it for the others
+        content = await asyncio.shield(fetch_task)
+        if content:
+            _CONTENT_CACHE[path] = content
+        return content
+
+    @staticmethod
+    async def _fetch_content(path: str) -> Dict[str, Any]:
+        if ContentApiCircuitBreaker.is_open():
+            logger.warning(f"Skipping GOV UK Content API request for {path} while the API is failing")
+            return {}
+
+        url = f"{CONTENT_URL}/{path}"
         logger.debug(f"Fetching content from GOV UK Content API: {url}")
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
+        try:
+            async with GovUKHttpSession.get().get(url) as response:
                 if response.status == 404:
+                    ContentApiCircuitBreaker.record_success()
                     logger.warning(f"Content not found at path: {path}")
+                    _CONTENT_NOT_FOUND[path] = True
                     return {}
                 if response.status != 200:
+                    ContentApiCircuitBreaker.record_failure()
                     logger.error(f"Error fetching content: {response.status}")
                     return {}
+                if response.content_length == 0:
+                    ContentApiCircuitBreaker.record_success()
+                    return {}
+
+                content = orjson.loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            ContentApiCircuitBreaker.record_failure()
+            logger.error(f"Error fetching content for path {path}: {e!r}")
+            return {}
+
+        ContentApiCircuitBreaker.record_success()
+        return content
+
+    @staticmethod
+    async def get_contents_bulk(paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get content for several paths from the GOV UK Content API concurrently.
+
+        Args:
+            paths: The paths of the content to retrieve
 
-                return await response.json()
+        Returns:
+            List of content data in the same order as paths, with an empty dict for any path that failed
+        """
+        semaphore = asyncio.Semaphore(BULK_CONTENT_CONCURRENCY)
+
+        async def _get_one(path: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await GovUKContent.get_content(path)
+
+        results = await asyncio.gather(*[_get_one(path) for path in paths], return_exceptions=True)
+
+        contents = []
+        for path, result in zip(paths, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching content for path {path}: {result}")
+                contents.append({})
+            else:
+                contents.append(result)
+        return contents
 
     @staticmethod
     async def get_content_and_links(path: str) -> Tuple[Dict[str, Any], List[str]]:
@@ -44,20 +196,18 @@ class GovUKContent:
             path: The path of the content to retrieve
 
         Returns:
-            Tuple of (content_data, list_of_links)
+            Tuple of (content_data, list_of_links), with each link listed once
         """
         content = await GovUKContent.get_content(path)
         if not content:
             return {}, []
 
-        # Extract links from the content
-        links = []
-
-        # Add links from the content relationships
-        for _, link_data in content.get("links", {}).items():
-            if isinstance(link_data, list):
-                for item in link_data:
-                    if isinstance(item, dict) and "base_path" in item:
-                        links.append(item["base_path"])
+        # Extract links from the content relationships, keeping the first occurrence of each
+        link_groups = (link_data for link_data in content.get("links", {}).values() if isinstance(link_data, list))
+        links = dict.fromkeys(
+            _get_base_path(item)
+            for item in chain.from_iterable(link_groups)
+            if isinstance(item, dict) and "base_path" in item
+        )
 
-        return content, links
+        return content, list(links)
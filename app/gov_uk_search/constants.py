@@ -1,2 +1,3 @@
+GOV_UK_URL = "https://www.gov.uk"
 SEARCH_URL = "https://www.gov.uk/api/search.json"
 CONTENT_URL = "https://www.gov.uk/api/content"
@@ -1,7 +1,7 @@
-from decimal import Decimal
+from dataclasses import dataclass
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 
 
 class DocumentBlacklistStatus(str, Enum):
@@ -10,14 +10,29 @@ class DocumentBlacklistStatus(str, Enum):
 
 
 class NonRagDocument(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     url: str
     title: str
     body: str
     status: DocumentBlacklistStatus
 
 
-class SearchCost(BaseModel):
-    total_cost: Decimal = Field(default_factory=Decimal)
-    search_tool_cost: Decimal = Field(default_factory=Decimal)
-    relevancy_assessment_cost: Decimal = Field(default_factory=Decimal)
+@dataclass(slots=True)
+class SearchCost:
+    total_cost: float = 0.0
+    search_tool_cost: float = 0.0
+    relevancy_assessment_cost: float = 0.0
     relevancy_assessment_count: int = 0
+
+
+@dataclass(slots=True)
+class SearchCandidate:
+    """A GOV UK Search API result waiting to be assessed for relevancy."""
+
+    title: str
+    description: str
+    link: str
+    query_id: int
+    position: int
+    full_content: str = ""
@@ -1,19 +1,21 @@
 import asyncio
+import hashlib
 import re
+from contextlib import aclosing
 from datetime import datetime
-from decimal import Decimal
-from typing import Any, Dict, List, Tuple
+from typing import Any, AsyncIterator, Dict, List, Tuple
 from urllib.parse import urlparse
 
-import aiohttp
 import httpx
+import orjson
 from anthropic.types.message import Message as AnthropicMessage
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
 from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.bedrock import BedrockHandler, RunMode
 from app.bedrock.tools_use import (
+    BATCH_DOCUMENT_RELEVANCE_ASSESSMENT,
     DOCUMENT_RELEVANCE_ASSESSMENT,
     DOWNLOAD_URLS,
     NAME_USE_GOV_UK_SEARCH_ASSESSMENT,
@@ -32,84 +34,34 @@ from app.config import (
 )
 from app.database.db_operations import DbOperations
 from app.database.models import Chat, GovUkSearchResult, Message, UseGovUkSearchDecision
-from app.database.table import LLMTable
-from app.gov_uk_search.constants import CONTENT_URL
-from app.gov_uk_search.schemas import DocumentBlacklistStatus, NonRagDocument, SearchCost
-from app.gov_uk_search.utils import build_search_url
+from app.database.table import LLMTable, async_db_session
+from app.gov_uk_search.client import GovUKContent, GovUKHttpSession
+from app.gov_uk_search.constants import GOV_UK_URL
+from app.gov_uk_search.schemas import DocumentBlacklistStatus, NonRagDocument, SearchCandidate, SearchCost
+from app.gov_uk_search.utils import GovUKHttpxClient, build_search_url, parse_gov_uk_html, strip_html
 from app.logs.logs_handler import logger
 
-
-class GovUKContent:
-    @staticmethod
-    async def get_content(path: str) -> Dict[str, Any]:
-        """
-        Get content from the GOV UK Content API.
-
-        Args:
-            path: The path of the content to retrieve (without leading slash)
-
-        Returns:
-            Dict containing the content data
-
-        Example:
-            >>> await GovUKContent.get_content("help/cookies")
-        """
-        url = f"{CONTENT_URL}/{path.lstrip('/')}"
-        logger.debug(f"Fetching content from GOV UK Content API: {url}")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 404:
-                    logger.warning(f"Content not found at path: {path}")
-                    return {}
-                if response.status != 200:
-                    logger.error(f"Error fetching content: {response.status}")
-                    return {}
-
-                return await response.json()
-
-    @staticmethod
-    async def get_content_and_links(path: str) -> Tuple[Dict[str, Any], List[str]]:
-        """
-        Get content and extract all internal links from it.
-
-        Args:
-            path: The path of the content to retrieve
-
-        Returns:
-            Tuple of (content_data, list_of_links)
-        """
-        content = await GovUKContent.get_content(path)
-        if not content:
-            return {}, []
-
-        # Extract links from the content
-        links = []
-
-        # Add links from the content relationships
-        for _, link_data in content.get("links", {}).items():
-            if isinstance(link_data, list):
-                for item in link_data:
-                    if isinstance(item, dict) and "base_path" in item:
-                        links.append(item["base_path"])
-
-        return content, links
+_HTTP_PREFIXES = ("http://", "https://")
+"""
+Prefixes of links that already include a scheme and do not need hydrating with the GOV UK domain.
+"""
 
 
 class GovUKSearch:
     @staticmethod
-    async def simple_search(
+    async def search_api_request(
         query: str,
-        db_session: AsyncSession,
         count: int = GOV_UK_SEARCH_MAX_COUNT,
         order_by_field_name: str = "",
         descending_order: bool = False,
         start: int = 0,
         fields: list[str] | None = None,
         filter_by_field: list[tuple[str, Any]] | None = None,
-        llm_internal_response_id_query: int | None = None,
-        message_id: int | None = None,
-    ) -> Tuple[Dict[str, Any], int]:
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Calls the GOV UK Search API without recording the query.
+        Returns (search_url, response_data), with empty results if the request failed.
+        """
         get_url = build_search_url(
             query=query,
             count=count,
@@ -132,49 +84,64 @@ class GovUKSearch:
             f"'{order_by_field_name}', descending: {descending_order}, fields: {fields}, filters: {filter_by_field}"
         )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(get_url) as response:
-                # Log the response status and headers for debugging
-                logger.debug(f"GOV UK Search API response status: {response.status}")
-                logger.debug(f"GOV UK Search API response headers: {response.headers}")
-
-                # Check if the response is successful
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"GOV UK Search API error: {response.status} - {error_text}")
-                    logger.error(f"Failed GOV UK Search URL request: {get_url}")
-                    # Return an empty response with a default query ID
-                    empty_response = {"results": [], "total": 0}
-
-                    # Log the LLM-generated query passed on to the GOV UK Search API
-                    gov_uk_search_query = await DbOperations.insert_gov_uk_search_query(
-                        db_session=db_session,
-                        llm_internal_response_id=llm_internal_response_id_query,
-                        message_id=message_id,
-                        query=get_url,
-                    )
+        async with GovUKHttpSession.get().get(get_url) as response:
+            # Log the response status and headers for debugging
+            logger.debug(f"GOV UK Search API response status: {response.status}")
+            logger.debug(f"GOV UK Search API response headers: {response.headers}")
+
+            # Check if the response is successful
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"GOV UK Search API error: {response.status} - {error_text}")
+                logger.error(f"Failed GOV UK Search URL request: {get_url}")
+                # Return an empty response
+                return get_url, {"results": [], "total": 0}
+
+            # Try to parse the response as JSON
+            response_body = await response.read()
+            try:
+                response_data = orjson.loads(response_body)
+                logger.debug(f"GOV UK Search API response: {response_data}")
+            except orjson.JSONDecodeError as e:
+                # If the response is not JSON, log the error and return an empty response
+                error_text = response_body[:500].decode(errors="replace")
+                logger.error(f"GOV UK Search API JSON decode error: {e} - Response text: {error_text}")
+                response_data = {"results": [], "total": 0}
+
+            return get_url, response_data
 
-                    return empty_response, gov_uk_search_query
-
-                # Try to parse the response as JSON
-                try:
-                    response_data = await response.json()
-                    logger.debug(f"GOV UK Search API response: {response_data}")
-                except aiohttp.client_exceptions.ContentTypeError as e:
-                    # If the response is not JSON, log the error and return an empty response
-                    error_text = await response.text()
-                    logger.error(f"GOV UK Search API content type error: {e} - Response text: {error_text[:500]}")
-                    response_data = {"results": [], "total": 0}
-
-                # Log the LLM-generated query passed on to the GOV UK Search API
-                gov_uk_search_query = await DbOperations.insert_gov_uk_search_query(
-                    db_session=db_session,
-                    llm_internal_response_id=llm_internal_response_id_query,
-                    message_id=message_id,
-                    query=get_url,
-                )
+    @staticmethod
+    async def simple_search(
+        query: str,
+        db_session: AsyncSession,
+        count: int = GOV_UK_SEARCH_MAX_COUNT,
+        order_by_field_name: str = "",
+        descending_order: bool = False,
+        start: int = 0,
+        fields: list[str] | None = None,
+        filter_by_field: list[tuple[str, Any]] | None = None,
+        llm_internal_response_id_query: int | None = None,
+        message_id: int | None = None,
+    ) -> Tuple[Dict[str, Any], int]:
+        get_url, response_data = await GovUKSearch.search_api_request(
+            query=query,
+            count=count,
+            order_by_field_name=order_by_field_name,
+            descending_order=descending_order,
+            start=start,
+            fields=fields,
+            filter_by_field=filter_by_field,
+        )
+
+        # Log the LLM-generated query passed on to the GOV UK Search API
+        gov_uk_search_query = await DbOperations.insert_gov_uk_search_query(
+            db_session=db_session,
+            llm_internal_response_id=llm_internal_response_id_query,
+            message_id=message_id,
+            query=get_url,
+        )
 
-                return response_data, gov_uk_search_query
+        return response_data, gov_uk_search_query
 
 
 async def get_search_documents(
@@ -211,9 +178,9 @@ async def get_search_documents(
 
     # Create cost information dictionary
     cost_info = {
-        "total_cost": float(search_cost.total_cost),
-        "search_tool_cost": float(search_cost.search_tool_cost),
-        "relevancy_assessment_cost": float(search_cost.relevancy_assessment_cost),
+        "total_cost": search_cost.total_cost,
+        "search_tool_cost": search_cost.search_tool_cost,
+        "relevancy_assessment_cost": search_cost.relevancy_assessment_cost,
         "relevancy_assessment_count": search_cost.relevancy_assessment_count,
     }
 
@@ -253,7 +220,7 @@ async def get_search_documents(
 #     return valid_documents, citations
 
 
-async def process_documents(documents: List[Any]) -> str:
+def process_documents(documents: List[Any]) -> str:
     """
     Process documents and wrap them for inclusion in the prompt.
 
@@ -263,17 +230,14 @@ async def process_documents(documents: List[Any]) -> str:
     Returns:
         Formatted document content
     """
-    wrapped_document = ""
-    for i, document in enumerate(documents, 1):
-        wrapped_document += f"<gov-uk-search-result-{i}>\n"
-        wrapped_document += f"<document-title>{document.title}</document-title>\n"
-        wrapped_document += f"<document-url>{document.url}</document-url>\n"
-        wrapped_document += f"<document-body>\n{document.body}\n</document-body>\n"
-        wrapped_document += f"</gov-uk-search-result-{i}>"
-        if i < len(documents):
-            wrapped_document += "\n"
-
-    return wrapped_document
+    return "\n".join(
+        f"<gov-uk-search-result-{i}>\n"
+        f"<document-title>{document.title}</document-title>\n"
+        f"<document-url>{document.url}</document-url>\n"
+        f"<document-body>\n{document.body}\n</document-body>\n"
+        f"</gov-uk-search-result-{i}>"
+        for i, document in enumerate(documents, 1)
+    )
 
 
 async def enhance_user_prompt(
@@ -322,7 +286,7 @@ async def enhance_user_prompt(
     #     all_citations.extend(web_citations)
 
     # Process documents for inclusion in prompt
-    wrapped_documents = await process_documents(all_documents)
+    wrapped_documents = process_documents(all_documents)
 
     return wrapped_documents, all_citations
 
@@ -339,59 +303,40 @@ async def extract_content_with_httpx(url: str) -> str:
         Extracted content as a string
     """
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract content
-            result = []
-
-            # Get title
-            title_elem = soup.find("h1")
-            if title_elem:
-                result.append(f"# {title_elem.get_text().strip()}")
-                result.append("")
-
-            # Get metadata
-            metadata_elems = soup.select(".app-c-publisher-metadata, .gem-c-metadata")
-            if metadata_elems:
-                for elem in metadata_elems:
-                    meta_text = elem.get_text().strip()
-                    if meta_text:
-                        result.append(meta_text)
-                result.append("")
-
-            # Get main content
-            content_elem = soup.select_one("#content, .govuk-grid-column-two-thirds")
-            if content_elem:
-                # Extract paragraphs and headings
-                for elem in content_elem.find_all(["p", "h2", "h3", "h4", "li"]):
-                    text = elem.get_text().strip()
-                    if text:
-                        if elem.name.startswith("h"):
-                            # Add markdown heading format
-                            level = int(elem.name[1])
-                            result.append(f"{'#' * level} {text}")
-                        else:
-                            result.append(text)
-                        result.append("")
-
-            # Join all parts
-            full_content = "\n".join(result)
-            return full_content
+        response = await GovUKHttpxClient.get().get(url)
+        response.raise_for_status()
+
+        # Parse the page off the event loop so other searches keep making progress
+        return await asyncio.to_thread(parse_gov_uk_html, response.content)
 
     except (httpx.HTTPError, Exception) as e:
         logger.warning(f"Error fetching content with httpx: {str(e)}")
         return ""
 
 
+EXTRACTED_CONTENT_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+"""
+Extracted GOV UK page content keyed by normalised URL, kept for an hour, so popular pages found by
+different users' searches are only fetched and parsed once.
+"""
+
+EXTRACTED_CONTENT_FAILURE_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+"""
+Normalised URLs whose content could not be extracted by either method, kept for a minute so failing
+pages are not retried by every search that finds them.
+"""
+
+
+def _normalise_gov_uk_url(url: str) -> str:
+    parsed_url = urlparse(url)
+    return f"{parsed_url.scheme}://{parsed_url.netloc.lower()}{parsed_url.path}"
+
+
 async def extract_content_from_gov_uk(url: str) -> str:
     """
     Extract full content from GOV UK Content API for a given URL.
     Falls back to direct web scraping if the Content API fails.
+    Results are cached by URL, ignoring any query string or fragment.
 
     Args:
         url: The GOV UK URL
@@ -399,74 +344,135 @@ async def extract_content_from_gov_uk(url: str) -> str:
     Returns:
         Full content as a string
     """
-    # Extract path from URL
-    parsed_url = urlparse(url)
-    path = parsed_url.path.lstrip("/")
+    cache_key = _normalise_gov_uk_url(url)
+    full_content = EXTRACTED_CONTENT_CACHE.get(cache_key)
+    if full_content is None and cache_key in EXTRACTED_CONTENT_FAILURE_CACHE:
+        full_content = ""
+    if full_content is not None:
+        return full_content
 
-    # Try Content API first
-    content_data = await GovUKContent.get_content(path)
+    full_content = await _extract_content_from_gov_uk(url)
+    if full_content:
+        EXTRACTED_CONTENT_CACHE[cache_key] = full_content
+    else:
+        EXTRACTED_CONTENT_FAILURE_CACHE[cache_key] = True
+    return full_content
 
-    if content_data:
-        # Extract text content
-        result = []
 
-        # Get title
-        title = content_data.get("title", "")
-        if title:
-            result.append(f"# {title}")
-            result.append("")
+def _render_content_data(content_data: Dict[str, Any]) -> str:
+    """
+    Renders a GOV UK Content API response as markdown-style text.
+    """
+    # Extract text content
+    result = []
+
+    # Get title
+    title = content_data.get("title", "")
+    if title:
+        result.append(f"# {title}")
+        result.append("")
+
+    # Get document type
+    document_type = content_data.get("document_type", "")
+    if document_type:
+        result.append(f"Document type: {document_type}")
+        result.append("")
+
+    # Get description
+    description = content_data.get("description", "")
+    if description:
+        result.append(description)
+        result.append("")
+
+    # Get body content
+    details = content_data.get("details", {})
+
+    # Handle different content structures
+    if "body" in details:
+        # HTML content - extract text
+        body = details["body"]
+        # Simple HTML tag removal (a more sophisticated HTML parser could be used)
+        result.append(strip_html(body))
+
+    elif "parts" in details:
+        # Multi-part content
+        for part in details["parts"]:
+            part_title = part.get("title", "")
+            part_body = part.get("body", "")
+
+            if part_title:
+                result.append(f"## {part_title}")
+
+            if part_body:
+                # Remove HTML tags
+                result.append(strip_html(part_body))
 
-        # Get document type
-        document_type = content_data.get("document_type", "")
-        if document_type:
-            result.append(f"Document type: {document_type}")
             result.append("")
 
-        # Get description
-        description = content_data.get("description", "")
-        if description:
-            result.append(description)
-            result.append("")
+    # Add publication date if available
+    if "public_updated_at" in content_data:
+        result.append(f"Last updated: {content_data['public_updated_at']}")
 
-        # Get body content
-        details = content_data.get("details", {})
-
-        # Handle different content structures
-        if "body" in details:
-            # HTML content - extract text
-            body = details["body"]
-            # Simple HTML tag removal (a more sophisticated HTML parser could be used)
-            body = re.sub(r"<[^>]+>", " ", body)
-            body = re.sub(r"\s+", " ", body).strip()
-            result.append(body)
-
-        elif "parts" in details:
-            # Multi-part content
-            for part in details["parts"]:
-                part_title = part.get("title", "")
-                part_body = part.get("body", "")
-
-                if part_title:
-                    result.append(f"## {part_title}")
-
-                if part_body:
-                    # Remove HTML tags
-                    part_body = re.sub(r"<[^>]+>", " ", part_body)
-                    part_body = re.sub(r"\s+", " ", part_body).strip()
-                    result.append(part_body)
-
-                result.append("")
-
-        # Add publication date if available
-        if "public_updated_at" in content_data:
-            result.append(f"Last updated: {content_data['public_updated_at']}")
-
-        # Join all content parts
-        full_content = "\n".join(result)
-        return full_content
+    # Join all content parts
+    full_content = "\n".join(result)
+    return full_content
+
+
+RENDER_IN_THREAD_MIN_BODY_CHARS = 20_000
+"""
+The combined length of a Content API body above which it is rendered in a worker thread. Smaller bodies are rendered
+in well under a millisecond, less than the cost of handing them to a thread.
+"""
+
+
+def _content_data_body_length(content_data: Dict[str, Any]) -> int:
+    details = content_data.get("details", {})
+    if "body" in details:
+        return len(details["body"])
+    return sum(len(part.get("body", "")) for part in details.get("parts", []))
+
+
+def _gov_uk_url_path(url: str) -> str:
+    """
+    Returns the path of an absolute URL without its leading slash, query or fragment.
+    """
+    _, separator, rest = url.partition("://")
+    host, _, path = rest.partition("/")
+    if not separator or "?" in host or "#" in host:
+        return urlparse(url).path.lstrip("/")
+    return path.partition("?")[0].partition("#")[0].lstrip("/")
+
+
+_NO_CONTENT_API_PREFIXES = ("media/", "government/uploads/", "assets/")
+"""
+Paths of uploaded files and assets, which are never published through the GOV UK Content API.
+"""
+
+_NO_CONTENT_API_EXTENSIONS = (".pdf", ".doc", ".docx", ".odt", ".xls", ".xlsx", ".ods", ".csv")
+"""
+File extensions of attachments, which are never published through the GOV UK Content API.
+"""
+
+
+async def _extract_content_from_gov_uk(url: str) -> str:
+    # Extract path from URL
+    path = _gov_uk_url_path(url)
+
+    # Try Content API first, unless the path is an attachment it cannot have
+    if path.startswith(_NO_CONTENT_API_PREFIXES) or path.lower().endswith(_NO_CONTENT_API_EXTENSIONS):
+        logger.debug(f"Skipping the Content API for attachment {url}")
+    else:
+        content_data = await GovUKContent.get_content(path)
+
+        if content_data:
+            # Render long content off the event loop so other searches keep making progress
+            if _content_data_body_length(content_data) >= RENDER_IN_THREAD_MIN_BODY_CHARS:
+                return await asyncio.to_thread(_render_content_data, content_data)
+            return _render_content_data(content_data)
+
+        # Fallback to direct web scraping if Content API failed
+        logger.warning(f"Content API failed for {url}, falling back to direct web scraping")
 
-    # Fallback to direct web scraping if Content API failed
-    logger.warning(f"Content API failed for {url}, falling back to direct web scraping")
     content_from_httpx = await extract_content_with_httpx(url)
 
     if content_from_httpx:
@@ -541,9 +547,61 @@ async def get_relevant_documents_from_gov_uk_search(
     return relevant_documents, citations, search_cost
 
 
+async def _insert_committed_llm_internal_response(**llm_internal_response) -> int:
+    """
+    Records an LLM call in a session of its own that is committed straight away, returning the id of the record.
+    Used for LLM calls whose results are cached, as later requests record the cached results against this id,
+    which they could not do if it was only in the current request's transaction and that was rolled back.
+    """
+    async with async_db_session() as db_session:
+        response = await DbOperations.insert_llm_internal_response_id_query(
+            db_session=db_session, **llm_internal_response
+        )
+    return response.id
+
+
+def _deduplicate_search_terms(search_terms: List[str]) -> List[str]:
+    """
+    Removes repeated search terms, keeping the first occurrence and the order the LLM gave them in.
+    Terms are treated as the same when they contain the same words, ignoring case, spacing and word order,
+    so "UK VAT rates" and "vat rates uk" only produce one GOV UK search and one set of relevancy checks.
+    """
+    seen_words = set()
+    unique_terms = []
+    for term in search_terms:
+        words = frozenset(term.lower().split())
+        if words not in seen_words:
+            seen_words.add(words)
+            unique_terms.append(term)
+    return unique_terms
+
+
+SEARCH_QUERIES_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=600)
+"""
+Search terms and parameters generated for a standalone query, keyed by role and the query's words, kept for
+ten minutes as (search_terms, llm_response_id, search_params). Rephrasings that differ only in case, spacing
+or punctuation reuse the earlier LLM call. The short expiry keeps date ranges relative to today's date valid.
+"""
+
+
+_QUERY_WORD_RE = re.compile(r"\w+")
+
+
+def _normalise_query(query: str) -> str:
+    """
+    Reduces a query to its lowercased words, so rephrasings that differ only in case, spacing or punctuation
+    share cache entries.
+    """
+    return " ".join(_QUERY_WORD_RE.findall(query.lower()))
+
+
+def _search_queries_cache_key(role: str, query: str) -> Tuple[str, str]:
+    return role, _normalise_query(query)
+
+
 async def get_search_queries(
     role: str, query: str, db_session: AsyncSession, messages: list[Message] | None = None
-) -> Tuple[List[str], int, Dict[str, Any], Decimal]:
+) -> Tuple[List[str], int, Dict[str, Any], float]:
     """
     Get search terms and parameters from LLM for GOV UK Search API.
     Returns (search_terms, llm_response_id, search_params, cost)
@@ -557,6 +615,16 @@ async def get_search_queries(
             turns = "\n".join(f"{m['role'].upper()}: {m['content']}" for m in recent)
             conversation_context = f"\n\n<recent-conversation>\n{turns}\n</recent-conversation>"
 
+    # Follow-up queries depend on the conversation, so only standalone queries are served from the cache
+    cache_key = None
+    if not conversation_context:
+        cache_key = _search_queries_cache_key(role, query)
+        cached_queries = SEARCH_QUERIES_CACHE.get(cache_key)
+        if cached_queries is not None:
+            search_terms, llm_response_id, search_params = cached_queries
+            logger.debug(f"GOV UK Search - Reusing search terms for a matching query: {search_terms}")
+            return list(search_terms), llm_response_id, dict(search_params), 0.0
+
     # Prepare message for the LLM
     message = [
         {
@@ -587,12 +655,13 @@ async def get_search_queries(
     llm_response = await llm.invoke_async(message, tools=SEARCH_API_SEARCH_TERMS["tools"])
 
     # Log the raw tool response structure for debugging
-    llm_response_content = llm_response.dict().get("content", [])
+    llm_response_dict = llm_response.dict()
+    llm_response_content = llm_response_dict.get("content", [])
     tool_use_items = [item for item in llm_response_content if item.get("type") == "tool_use"]
     text_items = [item for item in llm_response_content if item.get("type") == "text"]
 
     logger.debug(
-        f"GOV UK Search - LLM response stop_reason: {llm_response.dict().get('stop_reason', 'N/A')}, "
+        f"GOV UK Search - LLM response stop_reason: {llm_response_dict.get('stop_reason', 'N/A')}, "
         f"content blocks: {len(llm_response_content)} "
         f"(tool_use: {len(tool_use_items)}, text: {len(text_items)})"
     )
@@ -606,21 +675,26 @@ async def get_search_queries(
         logger.warning("GOV UK Search - No tool_use blocks found in LLM response!")
 
     # Record the LLM transaction in the database
-    llm_internal_response = await DbOperations.insert_llm_internal_response_id_query(
-        db_session=db_session,
-        web_browsing_llm=llm.llm,
-        content=llm_response.content[0].text
+    llm_internal_response = {
+        "web_browsing_llm": llm.llm,
+        "content": llm_response.content[0].text
         if llm_response.content[0].type == "text"
         else str(llm_response.content[0].input),
-        tokens_in=llm_response.usage.input_tokens,
-        tokens_out=llm_response.usage.output_tokens,
-        completion_cost=llm_response.usage.input_tokens * llm.llm.input_cost_per_token
+        "tokens_in": llm_response.usage.input_tokens,
+        "tokens_out": llm_response.usage.output_tokens,
+        "completion_cost": llm_response.usage.input_tokens * llm.llm.input_cost_per_token
         + llm_response.usage.output_tokens * llm.llm.output_cost_per_token,
-    )
-    llm_response_id = llm_internal_response.id
+    }
+    if cache_key is not None:
+        # Committed before the search terms are cached, as later requests record their searches against it
+        llm_response_id = await _insert_committed_llm_internal_response(**llm_internal_response)
+    else:
+        llm_response_id = (
+            await DbOperations.insert_llm_internal_response_id_query(db_session=db_session, **llm_internal_response)
+        ).id
 
     # Calculate cost
-    cost = Decimal(
+    cost = float(
         llm_response.usage.input_tokens * llm.llm.input_cost_per_token
         + llm_response.usage.output_tokens * llm.llm.output_cost_per_token
     )
@@ -630,10 +704,7 @@ async def get_search_queries(
     search_params = {}
 
     try:
-        llm_response_dict = llm_response.dict()
-        content_items = llm_response_dict.get("content", [])
-
-        for item in content_items:
+        for item in llm_response_content:
             if item.get("type") == "tool_use":
                 input_data = item.get("input", {})
 
@@ -662,14 +733,46 @@ async def get_search_queries(
     except Exception as e:
         logger.exception(f"Error parsing LLM response for search terms: {e}")
 
-    # Deduplicate search terms
-    search_terms = list(set(search_terms))
+    search_terms = _deduplicate_search_terms(search_terms)
 
     logger.debug(f"GOV UK Search - Final deduplicated search terms: {search_terms}")
 
+    if cache_key is not None and tool_use_items:
+        SEARCH_QUERIES_CACHE[cache_key] = (tuple(search_terms), llm_response_id, dict(search_params))
+
     return search_terms, llm_response_id, search_params, cost
 
 
+async def _add_full_content(doc: SearchCandidate) -> None:
+    full_content = await extract_content_from_gov_uk(doc.link)
+
+    # If full content fetch failed, use the description as fallback
+    if not full_content:
+        logger.warning(f"Failed to fetch full content for {doc.link}, using description as fallback")
+        full_content = doc.description
+
+    doc.full_content = full_content
+
+
+async def _fetch_full_content_as_completed(documents: List[SearchCandidate]) -> AsyncIterator[int]:
+    """
+    Fetches the full content of all documents concurrently, yielding the index of each document once its
+    full content has been added.
+    """
+
+    async def fetch(i: int, doc: SearchCandidate) -> int:
+        await _add_full_content(doc)
+        return i
+
+    fetch_tasks = [asyncio.create_task(fetch(i, doc)) for i, doc in enumerate(documents)]
+    try:
+        for next_fetched in asyncio.as_completed(fetch_tasks):
+            yield await next_fetched
+    finally:
+        for task in fetch_tasks:
+            task.cancel()
+
+
 async def execute_searches(
     role: str,
     query: str,
@@ -678,7 +781,7 @@ async def execute_searches(
     m_user_id: int,
     llm_internal_response_id_query: int,
     db_session: AsyncSession,
-) -> Tuple[List[NonRagDocument], List[Dict[str, str]], Decimal]:
+) -> Tuple[List[NonRagDocument], List[Dict[str, str]], float]:
     """
     Execute GOV UK searches and assess document relevancy.
     Returns (relevant_documents, irrelevant_documents, total_relevancy_cost)
@@ -709,11 +812,12 @@ async def execute_searches(
             if not link:
                 continue
 
-            # Hydrate links that don't have the full domain
-            if link.startswith("/"):
-                link = f"https://www.gov.uk{link}"
-            elif not (link.startswith("http://") or link.startswith("https://")):
-                link = f"https://www.gov.uk/{link}"
+            # Hydrate links that don't have the full domain, only checking the scheme for links starting with "h"
+            first_char = link[0]
+            if first_char == "/":
+                link = GOV_UK_URL + link
+            elif first_char != "h" or not link.startswith(_HTTP_PREFIXES):
+                link = f"{GOV_UK_URL}/{link}"
 
             # Skip if we've already seen this link
             if link in seen_links:
@@ -721,94 +825,57 @@ async def execute_searches(
 
             seen_links.add(link)
             all_documents.append(
-                {
-                    "title": title,
-                    "description": description,
-                    "link": link,
-                    "query_id": query_id,
-                    "position": len(all_documents) + 1,  # Use position in list as position in results
-                }
-            )
-
-    # Fetch full content for all documents in parallel before relevancy assessment
-    content_fetch_tasks = []
-
-    if all_documents:
-        async with asyncio.TaskGroup() as tg:
-            for doc in all_documents:
-                content_fetch_tasks.append(
-                    {"doc": doc, "task": tg.create_task(extract_content_from_gov_uk(doc["link"]))}
+                SearchCandidate(
+                    title=title,
+                    description=description,
+                    link=link,
+                    query_id=query_id,
+                    position=len(all_documents) + 1,  # Use position in list as position in results
                 )
-
-        # Add full content to documents
-        for i, task_info in enumerate(content_fetch_tasks):
-            doc = task_info["doc"]
-            full_content = task_info["task"].result()
-
-            # If full content fetch failed, use the description as fallback
-            if not full_content:
-                logger.warning(f"Failed to fetch full content for {doc['link']}, using description as fallback")
-                full_content = doc["description"]
-
-            # Add full content to the document
-            all_documents[i]["full_content"] = full_content
-
-    # Now assess relevancy with full content
-    relevancy_tasks = []
-
-    async with asyncio.TaskGroup() as tg:
-        for doc in all_documents:
-            relevancy_tasks.append(
-                {
-                    "doc": doc,
-                    "task": tg.create_task(
-                        assess_document_relevancy(
-                            role=role,
-                            query=query,
-                            title=doc["title"],
-                            description=doc["description"],
-                            full_content=doc["full_content"],
-                            db_session=db_session,
-                        )
-                    ),
-                }
             )
 
-    # Process completed tasks
+    # Fetch full content for all documents in parallel, assessing relevancy in batches as the content arrives
+    async with aclosing(_fetch_full_content_as_completed(all_documents)) as fetched_indexes:
+        relevancy_assessments = await assess_documents_relevancy(
+            role=role, query=query, documents=all_documents, ready_indexes=fetched_indexes
+        )
+
+    # Process the assessments
     relevant_documents = []
     irrelevant_documents = []
-    total_relevancy_cost = Decimal(0)
-
-    for task_info in relevancy_tasks:
-        doc = task_info["doc"]
-        is_relevant, relevancy_cost, llm_internal_response_id = task_info["task"].result()
+    total_relevancy_cost = 0.0
+    search_result_rows = []
 
+    for doc, (is_relevant, relevancy_cost, llm_internal_response_id) in zip(
+        all_documents, relevancy_assessments, strict=True
+    ):
         total_relevancy_cost += relevancy_cost
 
-        # Record result in database
-        await record_search_result(
-            m_user_id=m_user_id,
-            llm_internal_response_id=llm_internal_response_id,
-            gov_uk_search_query_id=doc["query_id"],
-            url=doc["link"],
-            content=doc["full_content"],  # Store full content in database
-            is_used=is_relevant,
-            position=doc["position"],
-            db_session=db_session,
+        search_result_rows.append(
+            {
+                "llm_internal_response_id": llm_internal_response_id,
+                "message_id": m_user_id,
+                "gov_uk_search_query_id": doc.query_id,
+                "url": doc.link,
+                "content": doc.full_content,  # Store full content in database
+                "is_used": is_relevant,
+                "position": doc.position,
+            }
         )
 
         # Add to relevant or irrelevant documents list
         if is_relevant:
             # Create NonRagDocument with full content
             relevant_documents.append(
-                NonRagDocument(
-                    title=doc["title"], url=doc["link"], body=doc["full_content"], status=DocumentBlacklistStatus.OK
-                )
+                NonRagDocument(title=doc.title, url=doc.link, body=doc.full_content, status=DocumentBlacklistStatus.OK)
             )
 
         else:
-            irrelevant_documents.append({"title": doc["title"], "url": doc["link"]})
-            logger.debug(f"Document deemed not relevant: {doc['title']}")
+            irrelevant_documents.append({"title": doc.title, "url": doc.link})
+            logger.debug(f"Document deemed not relevant: {doc.title}")
+
+    # Record the results in the database in a single statement
+    await DbOperations.insert_gov_uk_search_results(db_session=db_session, search_results=search_result_rows)
 
     return relevant_documents, irrelevant_documents, total_relevancy_cost
 
@@ -825,10 +892,6 @@ async def perform_searches(
     Perform the actual GOV UK searches based on search terms and parameters.
     Returns a list of (search_result, query_record) tuples.
     """
-    search_tasks = []
-    search_queries = []  # Store the query terms in order
-    results = []
-
     # Prepare filter parameters
     filter_by_field = []
     if search_params:
@@ -864,181 +927,301 @@ async def perform_searches(
     # Standard fields to retrieve
     fields = ["title", "description", "link", "primary_publishing_organisation", "public_timestamp"]
 
-    # If we have no valid search terms, use empty query which defaults to popularity ordering
     valid_search_terms = [term for term in search_terms if term]
     if not valid_search_terms:
-        search_queries.append("empty query")
-        search_task = gov_uk_search.simple_search(
-            query="",
-            db_session=db_session,
-            count=count,
-            llm_internal_response_id_query=llm_internal_response_id_query,
-            message_id=message_id,
-            fields=fields,
-            filter_by_field=filter_by_field,
-            descending_order=True,
-        )
-        search_tasks.append(search_task)
+        # If we have no valid search terms, use empty query which defaults to popularity ordering
+        search_responses = [
+            await gov_uk_search.search_api_request(
+                query="",
+                count=count,
+                fields=fields,
+                filter_by_field=filter_by_field,
+                descending_order=True,
+            )
+        ]
     else:
-        # Create search tasks for each valid term
+        # Search for each valid term concurrently
         async with asyncio.TaskGroup() as tg:
-            for term in valid_search_terms:
-                search_queries.append(term)
-                task = tg.create_task(
-                    gov_uk_search.simple_search(
+            search_tasks = [
+                tg.create_task(
+                    gov_uk_search.search_api_request(
                         query=term,
-                        db_session=db_session,
                         count=count,
-                        llm_internal_response_id_query=llm_internal_response_id_query,
-                        message_id=message_id,
                         fields=fields,
                         filter_by_field=filter_by_field,
                         order_by_field_name=order_by_field_name,
                         descending_order=descending_order,
                     )
                 )
-                search_tasks.append(task)
+                for term in valid_search_terms
+            ]
+        search_responses = [task.result() for task in search_tasks]
 
-    # Execute search tasks
-    for _, task in enumerate(search_tasks):
-        if isinstance(task, asyncio.Task):
-            result = task.result()
-        else:
-            result = await task
-        results.append(result)
+    # Log the LLM-generated queries passed on to the GOV UK Search API in a single statement
+    query_records = await DbOperations.insert_gov_uk_search_queries(
+        db_session=db_session,
+        llm_internal_response_id=llm_internal_response_id_query,
+        message_id=message_id,
+        queries=[search_url for search_url, _ in search_responses],
+    )
 
-    return results
+    return [
+        (response_data, query_record)
+        for (_, response_data), query_record in zip(search_responses, query_records, strict=True)
+    ]
 
 
-async def assess_document_relevancy(
-    role: str, query: str, title: str, description: str, full_content: str, db_session: AsyncSession
-) -> Tuple[bool, Decimal, int]:
-    """
-    Assess if a document is relevant to the query using its full content.
+RELEVANCY_ASSESSMENT_CACHE: TTLCache = TTLCache(maxsize=8192, ttl=86400)
+"""
+Relevancy assessments keyed by a hash of the model, normalised query, page title and assessed content, kept
+for a day, as (is_relevant, llm_response_id). A popular query, or a rephrasing of it that differs only in case,
+spacing or punctuation, finding a page that has not changed reuses the earlier assessment instead of calling
+the LLM again.
+"""
+
+
+def _relevancy_assessment_cache_key(role: str, query: str, title: str, content_for_assessment: str) -> str:
+    key_parts = (LLM_DOCUMENT_RELEVANCY_MODEL, role, _normalise_query(query), title, content_for_assessment)
+    return hashlib.sha256("\0".join(key_parts).encode()).hexdigest()
+
+
+RELEVANCY_ASSESSMENT_CONTENT_TOKENS = 1700
+"""
+The approximate number of tokens of page content included in a relevancy assessment, estimated locally at 3.5 bytes
+of UTF-8 per token so no token counting request is needed before each assessment.
+"""
+
+_RELEVANCY_ASSESSMENT_CONTENT_BYTES = int(RELEVANCY_ASSESSMENT_CONTENT_TOKENS * 3.5)
+
+_GOV_UK_BOILERPLATE_LINES = frozenset(
+    {
+        "contents",
+        "print this page",
+        "share this page",
+        "related content",
+        "explore the topic",
+        "collection",
+        "is this page useful?",
+        "report a problem with this page",
+        "help us improve gov.uk",
+        "cookies on gov.uk",
+    }
+)
+"""
+Lowercased lines of GOV.UK page furniture, such as the contents heading and related links sidebar, which are picked
+up when a page is scraped and say nothing about whether the page is relevant.
+"""
 
-    Args:
-        role: Role for the LLM message
-        query: User query
-        title: Document title
-        description: Document description
-        full_content: Full document content
 
-    Returns:
-        Tuple of (is_relevant, cost, llm_response_id)
+def _without_boilerplate_lines(text: str) -> str:
+    """
+    Removes GOV.UK page furniture and repeated lines, such as links listed in both the body and the sidebar,
+    from page text, collapsing the blank lines left behind.
     """
+    lines = []
+    seen_lines = set()
+    for line in text.splitlines():
+        key = line.strip().lower()
+        if not key:
+            if lines and lines[-1]:
+                lines.append("")
+            continue
+        if key in _GOV_UK_BOILERPLATE_LINES or key in seen_lines:
+            continue
+        seen_lines.add(key)
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _content_for_relevancy_assessment(description: str, full_content: str) -> str:
     # Create a truncated version of the full content to avoid token limits
     # First use the description as a summary, then add as much of the full content as reasonable
     content_for_assessment = description
 
     # If full content is different from description, add a sample of it
     if full_content != description and len(full_content) > 0:
-        # Limit content to ~6000 characters to avoid excessive token usage
-        max_content_chars = 6000
-        truncated_content = full_content[:max_content_chars]
-        if len(full_content) > max_content_chars:
+        # Leave out page furniture and repeated lines so the budget is spent on the page's own content,
+        # only cleaning up to twice the budget as the rest would be truncated anyway
+        max_content_bytes = _RELEVANCY_ASSESSMENT_CONTENT_BYTES
+        source_content = full_content[: max_content_bytes * 2]
+        cleaned_content = _without_boilerplate_lines(source_content)
+
+        # Limit content by UTF-8 bytes rather than characters, as non-Latin text uses more tokens per character.
+        # A character is at least one byte, so only the first max bytes worth of characters need encoding.
+        truncated_content = cleaned_content[:max_content_bytes]
+        if not truncated_content.isascii():
+            truncated_content = truncated_content.encode()[:max_content_bytes].decode(errors="ignore")
+        if len(full_content) > len(source_content) or len(cleaned_content) > len(truncated_content):
             truncated_content += "... [content truncated]"
 
         content_for_assessment = f"{description}\n\nContent excerpt:\n{truncated_content}"
 
-    # Get LLM for document relevancy assessment
-    llm_obj = LLMTable().get_by_model(LLM_DOCUMENT_RELEVANCY_MODEL)
-    llm = BedrockHandler(llm=llm_obj, mode=RunMode.ASYNC)
-    messages = [
-        {
-            "role": role,
-            "content": (
-                f"<user-query>\n\n{query}\n\n</user-query>\n\n"
-                f"<retrieved-gov-uk-page>\n\n"
-                f"<retrieved-gov-uk-page-title>{title}</retrieved-gov-uk-page-title>\n\n"
-                f"<retrieved-gov-uk-page-content>{content_for_assessment}</retrieved-gov-uk-page-content>\n\n"
-                f"</retrieved-gov-uk-page>"
-            ),
-        }
-    ]
+    return content_for_assessment
 
-    try:
-        document_relevancy = await llm.invoke_async(
-            messages=messages,
-            tools=DOCUMENT_RELEVANCE_ASSESSMENT["tools"],
-            tool_choice={"type": "tool", "name": "assess_document_relevance"},
-        )
 
-        # Log tool response for relevancy assessment
-        relevancy_content = document_relevancy.dict().get("content", [])
-        relevancy_tool_items = [item for item in relevancy_content if item.get("type") == "tool_use"]
-        if relevancy_tool_items:
-            for tool_item in relevancy_tool_items:
-                logger.debug(
-                    f"GOV UK Search - Relevancy tool call for '{title}': "
-                    f"is_relevant={tool_item.get('input', {}).get('is_relevant')}, "
-                    f"reason={tool_item.get('input', {}).get('reason', 'N/A')}"
-                )
-        else:
-            logger.warning(f"GOV UK Search - No tool_use in relevancy response for '{title}'")
+RELEVANCY_ASSESSMENT_BATCH_SIZE = 6
+"""
+The maximum number of documents assessed in one relevancy LLM call. Larger result sets are split into batches
+which are assessed concurrently.
+"""
 
-        # Record the LLM transaction
+RELEVANCY_ASSESSMENT_CONCURRENCY = 8
+"""
+The maximum number of relevancy LLM calls made at once for one set of search results, so searches returning many
+documents do not exceed the Bedrock request rate limits.
+"""
 
-        response = await DbOperations.insert_llm_internal_response_id_query(
-            db_session=db_session,
+
+async def _invoke_relevancy_batch(
+    llm: BedrockHandler, role: str, query: str, batch: List[Tuple[str, str]]
+) -> Tuple[AnthropicMessage, Dict[int, bool]]:
+    retrieved_pages = "\n\n".join(
+        f'<retrieved-gov-uk-page index="{index}">\n\n'
+        f"<retrieved-gov-uk-page-title>{title}</retrieved-gov-uk-page-title>\n\n"
+        f"<retrieved-gov-uk-page-content>{content_for_assessment}</retrieved-gov-uk-page-content>\n\n"
+        f"</retrieved-gov-uk-page>"
+        for index, (title, content_for_assessment) in enumerate(batch, 1)
+    )
+    messages = [{"role": role, "content": f"<user-query>\n\n{query}\n\n</user-query>\n\n{retrieved_pages}"}]
+
+    llm_response = await llm.invoke_async(
+        messages=messages,
+        tools=BATCH_DOCUMENT_RELEVANCE_ASSESSMENT["tools"],
+        tool_choice={"type": "tool", "name": "assess_documents_relevance"},
+    )
+
+    verdicts = {}
+    for item in llm_response.dict().get("content", []):
+        if item.get("type") != "tool_use":
+            continue
+        for assessment in item.get("input", {}).get("assessments", []):
+            value = assessment.get("is_relevant", False)
+            verdicts[assessment.get("index")] = value == "True" or value is True
+
+    return llm_response, verdicts
+
+
+async def _all_ready(document_count: int) -> AsyncIterator[int]:
+    for i in range(document_count):
+        yield i
+
+
+async def assess_documents_relevancy(
+    role: str,
+    query: str,
+    documents: List[SearchCandidate],
+    ready_indexes: AsyncIterator[int] | None = None,
+) -> List[Tuple[bool, float, int]]:
+    """
+    Assess if several documents are relevant to the query using their full content, assessing up to
+    RELEVANCY_ASSESSMENT_BATCH_SIZE documents per LLM call and making up to RELEVANCY_ASSESSMENT_CONCURRENCY
+    calls at once.
+
+    Args:
+        role: Role for the LLM message
+        query: User query
+        documents: Search results with their full content
+        ready_indexes: Yields the index of each document once its full content is available, so a batch is
+            assessed as soon as it is full instead of after every document has been fetched.
+            By default all documents are ready.
+
+    Returns:
+        List of (is_relevant, cost, llm_response_id) in the same order as documents. The cost of each call is
+        split evenly between the documents it assessed.
+    """
+    assessments: List[Tuple[bool, float, int] | None] = [None] * len(documents)
+    batch_tasks: List[Tuple[List[Tuple[int, str, str, str]], asyncio.Task]] = []
+    pending = []
+    llm = None
+    semaphore = asyncio.Semaphore(RELEVANCY_ASSESSMENT_CONCURRENCY)
+
+    async def assess_batch(batch_pages: List[Tuple[str, str]]) -> Tuple[Dict[int, bool], float, int]:
+        async with semaphore:
+            llm_response, verdicts = await _invoke_relevancy_batch(llm, role, query, batch_pages)
+        cost = float(
+            llm_response.usage.input_tokens * llm.llm.input_cost_per_token
+            + llm_response.usage.output_tokens * llm.llm.output_cost_per_token
+        )
+        # Record the LLM transaction, committed before the assessments are cached
+        llm_response_id = await _insert_committed_llm_internal_response(
             web_browsing_llm=llm.llm,
-            content=document_relevancy.content[0].text
-            if document_relevancy.content[0].type == "text"
-            else str(document_relevancy.content[0].input),
-            tokens_in=document_relevancy.usage.input_tokens,
-            tokens_out=document_relevancy.usage.output_tokens,
-            completion_cost=document_relevancy.usage.input_tokens * llm.llm.input_cost_per_token
-            + document_relevancy.usage.output_tokens * llm.llm.output_cost_per_token,
+            content=llm_response.content[0].text
+            if llm_response.content[0].type == "text"
+            else str(llm_response.content[0].input),
+            tokens_in=llm_response.usage.input_tokens,
+            tokens_out=llm_response.usage.output_tokens,
+            completion_cost=cost,
         )
-        llm_response_id = response.id
+        return verdicts, cost, llm_response_id
 
-        # Calculate cost
-        cost = Decimal(
-            document_relevancy.usage.input_tokens * llm.llm.input_cost_per_token
-            + document_relevancy.usage.output_tokens * llm.llm.output_cost_per_token
-        )
+    def start_batch():
+        nonlocal llm
+        if llm is None:
+            llm = BedrockHandler(llm=LLMTable().get_by_model(LLM_DOCUMENT_RELEVANCY_MODEL), mode=RunMode.ASYNC)
+        batch = pending.copy()
+        pending.clear()
+        task = asyncio.create_task(assess_batch([(title, content) for _, _, title, content in batch]))
+        batch_tasks.append((batch, task))
 
-        # Determine if document is relevant
-        document_relevancy_dict = document_relevancy.dict()
-        content = document_relevancy_dict.get("content", [])
-        is_relevant_values = [
-            item.get("input", {}).get("is_relevant", False) for item in content if item.get("type") == "tool_use"
-        ]
+    try:
+        async for i in ready_indexes if ready_indexes is not None else _all_ready(len(documents)):
+            doc = documents[i]
+            content_for_assessment = _content_for_relevancy_assessment(doc.description, doc.full_content)
+            cache_key = _relevancy_assessment_cache_key(role, query, doc.title, content_for_assessment)
+            cached_assessment = RELEVANCY_ASSESSMENT_CACHE.get(cache_key)
+            if cached_assessment is not None:
+                is_relevant, llm_response_id = cached_assessment
+                assessments[i] = (is_relevant, 0.0, llm_response_id)
+                continue
 
-        is_relevant = False
-        if is_relevant_values:
-            value = is_relevant_values[0]
-            is_relevant = value == "True" or value is True
+            pending.append((i, cache_key, doc.title, content_for_assessment))
+            if len(pending) == RELEVANCY_ASSESSMENT_BATCH_SIZE:
+                start_batch()
 
-        return is_relevant, cost, llm_response_id
+        if pending:
+            start_batch()
+    except BaseException:
+        for _, task in batch_tasks:
+            task.cancel()
+        raise
 
-    except Exception as e:
-        logger.exception(f"Error assessing document relevancy: {e}")
-        return False, Decimal(0), 0
+    results = await asyncio.gather(*[task for _, task in batch_tasks], return_exceptions=True)
 
+    for (batch, _), result in zip(batch_tasks, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error(f"Error assessing document relevancy: {result}")
+            for i, _, _, _ in batch:
+                assessments[i] = (False, 0.0, 0)
+            continue
 
-async def record_search_result(
-    m_user_id: int,
-    llm_internal_response_id: int,
-    gov_uk_search_query_id: int,
-    url: str,
-    content: str,
-    is_used: bool,
-    position: int,
-    db_session: AsyncSession,
-) -> None:
+        verdicts, cost, llm_response_id = result
+        for index, (i, cache_key, title, _) in enumerate(batch, 1):
+            is_relevant = verdicts.get(index, False)
+            logger.debug(f"GOV UK Search - Relevancy for '{title}': is_relevant={is_relevant}")
+            # A document the LLM left out of its answer is treated as irrelevant this time, but assessed again later
+            if index in verdicts:
+                RELEVANCY_ASSESSMENT_CACHE[cache_key] = (is_relevant, llm_response_id)
+            assessments[i] = (is_relevant, cost / len(batch), llm_response_id)
+
+    return assessments
+
+
+_TRACKING_QUERY_PARAM_PREFIXES = ("utm_", "fbclid=", "gclid=")
+"""
+Prefixes of query parameters which only track where a link was shared and do not change the page it points to.
+"""
+
+
+def _url_deduplication_key(url: str) -> str:
     """
-    Record the search result in the database.
+    Returns a key which is the same for URLs that point to the same page, ignoring the scheme, letter case of the host,
+    a leading "www.", trailing slashes, tracking query parameters and the fragment.
     """
-    await DbOperations.insert_gov_uk_search_result(
-        db_session=db_session,
-        llm_internal_response_id=llm_internal_response_id,
-        message_id=m_user_id,
-        gov_uk_search_query_id=gov_uk_search_query_id,
-        url=url,
-        content=content,
-        is_used=is_used,
-        position=position,
+    parsed_url = urlparse(url)
+    query = "&".join(
+        param for param in parsed_url.query.split("&") if param and not param.startswith(_TRACKING_QUERY_PARAM_PREFIXES)
     )
+    return f"{parsed_url.netloc.lower().removeprefix('www.')}{parsed_url.path.rstrip('/')}?{query}"
 
 
 async def extract_urls_from_user_prompt(llm: BedrockHandler, role: str, query: str) -> List[str]:
@@ -1067,31 +1250,69 @@ async def extract_urls_from_user_prompt(llm: BedrockHandler, role: str, query: s
             if item.get("type") == "tool_use":
                 urls.extend(item.get("input", {}).get("urls", []))
 
-        # Process and deduplicate URLs
-        processed_urls = set()
+        # Process and deduplicate URLs, keeping the first of any URLs that point to the same page
+        processed_urls = {}
         for url in urls:
             # Hydrate URLs that don't have the full domain
             if url.startswith("/"):
-                url = f"https://www.gov.uk{url}"
-            elif not (url.startswith("http://") or url.startswith("https://")):
+                url = GOV_UK_URL + url
+            elif not url.startswith(_HTTP_PREFIXES):
                 # Check if it might be a gov.uk URL (without protocol)
                 if "gov.uk" in url:
                     url = f"https://{url}"
                 else:
-                    url = f"https://www.gov.uk/{url}"
+                    url = f"{GOV_UK_URL}/{url}"
 
-            processed_urls.add(url)
+            processed_urls.setdefault(_url_deduplication_key(url), url)
 
-        return list(processed_urls)
+        return list(processed_urls.values())
 
     except Exception as e:
         logger.exception(f"Error extracting URLs from prompt: {e}")
         return []
 
 
+_EXPLICIT_GOV_UK_SEARCH_RE = re.compile(
+    r"\b(?:search|look (?:up|on|at|in)|check)\s+(?:on\s+|in\s+|the\s+)?gov\.?\s?uk\b", re.IGNORECASE
+)
+"""
+Matches a message explicitly asking for GOV.UK to be searched, e.g. "search GOV.UK for" or "check gov.uk".
+"""
+
+_SEARCH_REQUEST_NEGATION_RE = re.compile(r"\b(?:not|don[’']?t|never|without|no need to)\b", re.IGNORECASE)
+"""
+Matches words that turn an explicit request to search GOV.UK into a request not to, e.g. "don't search GOV.UK".
+"""
+
+
+def _is_explicit_gov_uk_search_request(content: str) -> bool:
+    """
+    Returns whether the message explicitly asks for GOV.UK to be searched, in which case the LLM would always
+    recommend searching, so the decision can be made without calling it.
+    """
+    match = _EXPLICIT_GOV_UK_SEARCH_RE.search(content)
+    if match is None:
+        return False
+    return _SEARCH_REQUEST_NEGATION_RE.search(content, max(0, match.start() - 30), match.start()) is None
+
+
 async def assess_if_next_message_should_use_gov_uk_search(
     messages: list[Message], new_user_message_content: str, new_user_message_id: int, db_session: AsyncSession
 ) -> bool:
+    if not new_user_message_content.strip():
+        return False
+
+    if _is_explicit_gov_uk_search_request(new_user_message_content):
+        logger.debug(f"[GOV_UK_ASSESSMENT] Explicit GOV.UK search request in message_id={new_user_message_id}")
+        await db_session.execute(
+            insert(UseGovUkSearchDecision).values(
+                llm_internal_response_id=None,
+                message_id=new_user_message_id,
+                decision=True,
+            )
+        )
+        return True
+
     llm_obj = LLMTable().get_by_model(LLM_GOV_UK_SEARCH_FOLLOWUP_ASSESSMENT)
     llm = BedrockHandler(llm=llm_obj, mode=RunMode.ASYNC)
 
@@ -9,5 +9,5 @@ IS_READY = True
 
 
 @router.get("", status_code=status.HTTP_200_OK)
-def get_health_check():
+async def get_health_check():
     return {"status": "fine"}
@@ -1,3 +1,6 @@
+import asyncio
+import contextvars
+import functools
 import logging
 
 import bugsnag
@@ -13,6 +16,17 @@ from app.auth.constants import USER_KEY_UUID_ALIAS
 logger = logging.getLogger(__name__)
 
 
+def notify_bugsnag_in_background(exc: Exception, **options):
+    """
+    Reports an exception to Bugsnag from the default executor, so the event loop is not held up.
+
+    bugsnag.notify builds and hands off the report synchronously. The context is copied so the report keeps
+    the request details recorded by BugsnagMiddleware.
+    """
+    notify = functools.partial(bugsnag.notify, exc, **options)
+    asyncio.get_running_loop().run_in_executor(None, contextvars.copy_context().run, notify)
+
+
 class BugsnagLogger:
     """
     BugsnagLogger is responsible for configuring Bugsnag integration, capturing ERROR level logs and sending
@@ -42,13 +56,15 @@ class BugsnagLogger:
     def _configure_bugsnag(self):
         """
         Configure Bugsnag with the API key and release stage. Filters sensitive parameters
-        like 'Auth-Token' from being logged by Bugsnag.
+        like 'Auth-Token' from being logged by Bugsnag, and delivers reports in the background
+        rather than posting them inline.
         """
         bugsnag.configure(
             api_key=self.BUGSNAG_API_KEY,
             project_root=".",
             release_stage=self.BUGSNAG_RELEASE_STAGE,
             params_filters=["Auth-Token"],
+            asynchronous=True,
         )
 
     def _get_user_data_from_request_header(self, request: Request) -> dict:
@@ -56,14 +72,14 @@ class BugsnagLogger:
         return {"id": user_key_uuid, "name": None, "email": None}
 
     async def _catch_all_exception_handler(self, request: Request, exc: Exception) -> JSONResponse:
-        bugsnag.notify(exc, user=self._get_user_data_from_request_header(request))
+        notify_bugsnag_in_background(exc, user=self._get_user_data_from_request_header(request))
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"message": "Internal server error"},
         )
 
     async def _not_found_exception_handler(self, request: Request, exc: Exception) -> JSONResponse:
-        bugsnag.notify(exc, user=self._get_user_data_from_request_header(request))
+        notify_bugsnag_in_background(exc, user=self._get_user_data_from_request_header(request))
         logger.info(f"404 error: {str(exc)}")
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -71,7 +87,7 @@ class BugsnagLogger:
         )
 
     async def _validation_exception_handler(self, request: Request, exc: RequestValidationError) -> JSONResponse:
-        bugsnag.notify(exc, user=self._get_user_data_from_request_header(request))
+        notify_bugsnag_in_background(exc, user=self._get_user_data_from_request_header(request))
         return JSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={"detail": exc.errors()},
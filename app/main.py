@@ -1,16 +1,20 @@
 # ruff: noqa: F401
 
 import asyncio
-from asyncio import exceptions
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import IS_DEV, SMART_TARGETS_SERVICE_DISABLED, URL_HOSTNAME
 from app.database.table import AsyncEngineProvider
+from app.document_upload.utils import wait_for_audit_tasks
 from app.exceptions.handlers import register_exception_handlers
+from app.gov_uk_search.client import GovUKHttpSession
+from app.gov_uk_search.utils import GovUKHttpxClient
 from app.logs import BUGSNAG_ENABLED, BugsnagLogger
 from app.logs.logs_handler import logger, session_id_var
 from app.opensearch.service import verify_connection_to_opensearch
@@ -33,25 +37,49 @@ async def lifespan(app: FastAPI):
         None: Yields control to the main API code
     """
     # Startup code is written here
-    verify_connection_to_opensearch()
+    # Tasks start running as soon as they are created, so cache hits and other coroutines that finish without
+    # waiting never get scheduled on the event loop
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # The OpenSearch and GCS Data API checks are independent, so run them at the same time
+    connection_checks = [asyncio.to_thread(verify_connection_to_opensearch)]
 
     # Verify connection with the GCS Data API
     if SMART_TARGETS_SERVICE_DISABLED and IS_DEV:
         logger.info("Skipping Smart Targets Service connection verification")
     else:
-        await SmartTargetsService().verify_connection()
+        connection_checks.append(SmartTargetsService().verify_connection())
+
+    await asyncio.gather(*connection_checks)
 
     # Now yield to the main API code
     yield
 
     # Shutdown code can be written here
+    logger.info("Waiting for query audit writes to finish")
+    await wait_for_audit_tasks()
+
     logger.info("Closing DB connections")
     await AsyncEngineProvider.get().dispose()
 
+    logger.info("Closing GOV UK API sessions")
+    await GovUKHttpSession.close()
+    await GovUKHttpxClient.close()
+
 
 app = FastAPI(title="GCS Assist API", version="0.1.0", lifespan=lifespan)
 app.openapi_version = "3.0.2"
 REQUEST_TIMEOUT_SECS = 120
+REQUEST_TIMED_OUT_BODY = orjson.dumps(
+    {
+        "status": "failed",
+        "error_code": "REQUEST_TIMED_OUT",
+        "status_message": "Server failed to process the request on time",
+    }
+)
+"""
+The body of the 503 response sent when a request times out, serialised once as it never changes.
+"""
 
 # Configure CORS
 if IS_DEV:
@@ -77,26 +105,50 @@ if BUGSNAG_ENABLED:
     bugsnag_logger.setup_bugsnag(app)
 
 
-@app.middleware("http")
-async def request_middleware(request: Request, call_next):
-    # Set session ID from header
-    session_id = request.headers.get("Session-Auth")
-    if session_id:
-        session_id_var.set(session_id)
-
-    # Apply global timeout
-    try:
-        response = await asyncio.wait_for(call_next(request), timeout=REQUEST_TIMEOUT_SECS)
-        return response
-    except exceptions.TimeoutError:
-        return JSONResponse(
-            status_code=503,
-            content={
-                "status": "failed",
-                "error_code": "REQUEST_TIMED_OUT",
-                "status_message": "Server failed to process the request on time",
-            },
-        )
+class RequestMiddleware:
+    """
+    Sets the session ID from the Session-Auth header and applies the global request timeout.
+    Written as a pure ASGI middleware, as `@app.middleware("http")` runs each request through a separate task and
+    memory channel. As with `call_next`, the timeout covers the time until the response starts, so streamed
+    responses are not cut off part way through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Set session ID from header
+        for name, value in scope["headers"]:
+            if name == b"session-auth":
+                if value:
+                    session_id_var.set(value.decode("latin-1"))
+                break
+
+        # Apply global timeout until the response starts
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start" and not response_started:
+                response_started = True
+                timeout.reschedule(None)
+            await send(message)
+
+        try:
+            async with asyncio.timeout(REQUEST_TIMEOUT_SECS) as timeout:
+                await self.app(scope, receive, send_wrapper)
+        except TimeoutError:
+            if response_started:
+                raise
+            response = Response(content=REQUEST_TIMED_OUT_BODY, status_code=503, media_type="application/json")
+            await response(scope, receive, send)
+
+
+app.add_middleware(RequestMiddleware)
 
 
 for router in routers:
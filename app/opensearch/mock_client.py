@@ -55,6 +55,11 @@ class MockAsyncOpenSearch:
     async def search(self, *args, **kwargs):
         return dict(_EMPTY_SEARCH)
 
+    async def msearch(self, *args, body=None, **kwargs):
+        body = body or []
+        n = len(body) // 2  # body alternates header / search-body pairs
+        return {"responses": [dict(_EMPTY_SEARCH) for _ in range(n)]}
+
     async def bulk(self, *args, body=None, **kwargs):
         body = body or []
         n = len(body) // 2  # body alternates action-header / document pairs
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenSearchRecord:
     """An internal representation of the data we need to submit a record to OpenSearch to create a record."""
 
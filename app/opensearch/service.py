@@ -21,6 +21,7 @@ from app.document_upload.constants import PERSONAL_DOCUMENTS_INDEX_NAME
 from app.logs import Action, LogsHandler
 from app.opensearch.exceptions import DocumentOperationError
 from app.opensearch.mock_client import MockAsyncOpenSearch, MockOpenSearch
+from app.opensearch.serializer import OrjsonSerializer
 
 logging.getLogger("opensearch").setLevel(logging.ERROR)
 
@@ -110,6 +111,7 @@ def create_async_client():
         verify_certs=False,
         ssl_assert_hostname=False,
         ssl_show_warn=False,
+        serializer=OrjsonSerializer(),
     )
 
 
@@ -354,23 +356,9 @@ class AsyncOpenSearchOperations:
             raise ex
 
     @staticmethod
-    async def search_multiple_document_chunks(
-        document_uuids: List[str], query: str, index: str, max_size: int = 50
-    ) -> List[Dict]:
-        """
-        Searches for document chunks across multiple documents using the provided query.
-
-        Args:
-            document_uuids (List[str]): List of document UUIDs to search within.
-            query (str): The search query to match against document chunks.
-            index (str): The name of the OpenSearch index to search in.
-            max_size (int): Maximum number of chunks to return. Defaults to 50.
-
-        Returns:
-            List[Dict]: List of document chunks matching the query across all specified documents.
-        """
-        logger.debug("searching index: %s with documents: %s and user query: %s", index, document_uuids, query)
-
+    def _multiple_document_chunks_search_body(
+        document_uuids: List[str], query: str, max_size: int, source_fields: Optional[List[str]] = None
+    ) -> Dict:
         search_body = {
             "query": {
                 "bool": {
@@ -389,6 +377,29 @@ class AsyncOpenSearchOperations:
             },
             "size": max_size,
         }
+        if source_fields is not None:
+            search_body["_source"] = source_fields
+        return search_body
+
+    @staticmethod
+    async def search_multiple_document_chunks(
+        document_uuids: List[str], query: str, index: str, max_size: int = 50
+    ) -> List[Dict]:
+        """
+        Searches for document chunks across multiple documents using the provided query.
+
+        Args:
+            document_uuids (List[str]): List of document UUIDs to search within.
+            query (str): The search query to match against document chunks.
+            index (str): The name of the OpenSearch index to search in.
+            max_size (int): Maximum number of chunks to return. Defaults to 50.
+
+        Returns:
+            List[Dict]: List of document chunks matching the query across all specified documents.
+        """
+        logger.debug("searching index: %s with documents: %s and user query: %s", index, document_uuids, query)
+
+        search_body = AsyncOpenSearchOperations._multiple_document_chunks_search_body(document_uuids, query, max_size)
         logger.debug("built search query %s", search_body)
 
         # Perform the search
@@ -408,6 +419,67 @@ class AsyncOpenSearchOperations:
         # return no match
         return []
 
+    @staticmethod
+    async def msearch_multiple_document_chunks(
+        document_uuids: List[str],
+        queries: List[str],
+        index: str,
+        max_size: int = 50,
+        source_fields: Optional[List[str]] = None,
+    ) -> List[List[Dict]]:
+        """
+        Searches for document chunks across multiple documents for several queries in a single
+        OpenSearch multi-search request.
+
+        Args:
+            document_uuids (List[str]): List of document UUIDs to search within.
+            queries (List[str]): The search queries to match against document chunks.
+            index (str): The name of the OpenSearch index to search in.
+            max_size (int): Maximum number of chunks to return per query. Defaults to 50.
+            source_fields (Optional[List[str]]): The `_source` fields to return for each chunk. Defaults to all fields.
+
+        Returns:
+            List[List[Dict]]: The matching document chunks for each query, in the same order as `queries`.
+            A query whose search fails is logged and returns no chunks.
+        """
+        if not queries:
+            return []
+
+        logger.debug("multi-searching index: %s with documents: %s and queries: %s", index, document_uuids, queries)
+
+        search_body = []
+        header = {"index": index}
+        for query in queries:
+            search_body.append(header)
+            search_body.append(
+                AsyncOpenSearchOperations._multiple_document_chunks_search_body(
+                    document_uuids, query, max_size, source_fields
+                )
+            )
+
+        try:
+            response = await AsyncOpenSearchClient.get().msearch(body=search_body)
+        except Exception as e:
+            AsyncOpenSearchOperations._handle_search_error(e, str(queries), index, str(search_body))
+            return [[] for _ in queries]
+
+        results = []
+        for query, query_response in zip(queries, response["responses"], strict=True):
+            if "error" in query_response:
+                logger.error("Search error\nIndex:%s\nUser query:%s\nError:%s", index, query, query_response["error"])
+                results.append([])
+                continue
+            results.append(query_response["hits"]["hits"])
+
+        logger.info(
+            "%s chunks retrieved from %s for %s queries using docs %s",
+            sum(len(chunks) for chunks in results),
+            index,
+            len(queries),
+            document_uuids,
+        )
+        return results
+
     @staticmethod
     async def get_multiple_document_chunks(index: str, document_uuids: List[str], max_size: int = 1000) -> List[Dict]:
         """
@@ -1,8 +1,12 @@
 import logging
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.compaction.service import (
+    apply_summaries_to_messages,
     estimate_message_tokens,
+    perform_chat_compaction,
 )
+from app.database.models import Message
 
 logger = logging.getLogger(__name__)
 
@@ -48,3 +52,32 @@ def test_estimate_message_tokens_various_lengths():
     for content, expected in test_cases:
         result = estimate_message_tokens(content)
         assert result == expected, f"For content '{content}' expected {expected}, got {result}"
+
+
+def test_apply_summaries_to_messages_only_updates_summarised_messages():
+    messages = [Message(id=1, summary=None), Message(id=2, summary="existing summary"), Message(id=3, summary=None)]
+
+    apply_summaries_to_messages(messages, {1: "new summary", 4: "unrelated summary"})
+
+    assert messages[0].summary == "new summary"
+    assert messages[1].summary == "existing summary"
+    assert messages[2].summary is None
+
+
+async def test_perform_chat_compaction_skips_when_lock_is_held_elsewhere():
+    db_session = AsyncMock()
+    db_session.add = MagicMock()
+    db_session.execute.return_value = MagicMock(scalar=MagicMock(return_value=False))
+
+    with (
+        patch("app.compaction.service.should_trigger_compaction", new_callable=AsyncMock, return_value=True),
+        patch("app.compaction.service.compact_chat_messages", new_callable=AsyncMock) as mock_compact,
+    ):
+        result = await perform_chat_compaction(1, "new message", db_session)
+
+    assert result == (False, {})
+    mock_compact.assert_not_awaited()
+    db_session.execute.assert_awaited_once()
+    db_session.add.assert_not_called()
+    db_session.flush.assert_not_awaited()
+    db_session.commit.assert_not_awaited()
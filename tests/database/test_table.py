@@ -1,9 +1,10 @@
 import logging
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from app.database.database_exception import DatabaseError
-from app.database.table import MessageTable
+from app.database.table import _LLM_BY_MODEL_CACHE, LLMTable, MessageTable
 
 logger = logging.getLogger(__name__)
 
@@ -40,3 +41,30 @@ class TestDatabaseException:
         assert exc_info.value.code, "No error code was given with the DataBase exception"
         assert exc_info.value.message, "No message was given with the DataBase exception"
         logger.info(f"DatabaseException was raised successfully: {exc_info.value.code=} {exc_info.value.message=}")
+
+
+@pytest.mark.unit
+class TestLLMTableCache:
+    @pytest.fixture(autouse=True)
+    def clear_llm_cache(self):
+        _LLM_BY_MODEL_CACHE.clear()
+        yield
+        _LLM_BY_MODEL_CACHE.clear()
+
+    def test_repeated_lookups_query_the_database_once(self):
+        llm = MagicMock(model="anthropic.claude")
+
+        with patch.object(LLMTable, "get_one_by", return_value=llm) as get_one_by:
+            first = LLMTable().get_by_model("anthropic.claude")
+            second = LLMTable().get_by_model("anthropic.claude")
+
+        assert first is second is llm
+        get_one_by.assert_called_once_with("model", "anthropic.claude")
+
+    def test_missing_models_are_not_cached(self):
+        with patch.object(LLMTable, "get_one_by", side_effect=DatabaseError(code=0, message="not found")) as get_one_by:
+            for _ in range(2):
+                with pytest.raises(DatabaseError):
+                    LLMTable().get_by_model("missing")
+
+        assert get_one_by.call_count == 2
@@ -2,6 +2,7 @@ import pytest
 
 from app.document_upload.personal_document_rag import (
     GLOBAL_CHARACTER_LIMIT,
+    ChunkScore,
     _apply_fair_document_distribution,
 )
 
@@ -17,7 +18,7 @@ class TestPersonalDocumentRAGUnit:
             document_configs: List of tuples (doc_uuid, num_chunks, chars_per_chunk, base_score)
 
         Returns:
-            Dictionary mapping chunk_id to chunk info
+            Dictionary mapping chunk_id to its ChunkScore
         """
         chunk_scores = {}
         chunk_counter = 0
@@ -28,8 +29,9 @@ class TestPersonalDocumentRAGUnit:
                 # Decreasing scores within each document
                 score = base_score - (i * 0.01)
 
-                chunk_scores[chunk_id] = {
-                    "chunk_data": {
+                chunk_scores[chunk_id] = ChunkScore(
+                    chunk_id=chunk_id,
+                    chunk_data={
                         "_id": chunk_id,
                         "_source": {
                             "document_uuid": doc_uuid,
@@ -39,11 +41,12 @@ class TestPersonalDocumentRAGUnit:
                         },
                         "_score": score,
                     },
-                    "total_score": score,
-                    "query_count": 1,
-                    "final_score": score,
-                    "character_count": chars_per_chunk,
-                }
+                    document_uuid=doc_uuid,
+                    total_score=score,
+                    query_count=1,
+                    final_score=score,
+                    character_count=chars_per_chunk,
+                )
                 chunk_counter += 1
 
         return chunk_scores
@@ -60,7 +63,7 @@ class TestPersonalDocumentRAGUnit:
         document_uuids = ["doc-small-1"]
 
         # Apply fair distribution
-        result_chunks = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
+        result_chunks, _ = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
 
         # Calculate total characters
         total_chars = sum(len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in result_chunks)
@@ -90,7 +93,7 @@ class TestPersonalDocumentRAGUnit:
         document_uuids = ["doc-large-1"]
 
         # Apply fair distribution
-        result_chunks = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
+        result_chunks, _ = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
 
         # Calculate total characters
         total_chars = sum(len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in result_chunks)
@@ -135,7 +138,7 @@ class TestPersonalDocumentRAGUnit:
         chunk_scores = self.create_dummy_chunk_scores(document_configs)
 
         # Apply fair distribution
-        result_chunks = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
+        result_chunks, _ = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
 
         # Calculate total characters and document representation
         total_chars = sum(len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in result_chunks)
@@ -190,7 +193,7 @@ class TestPersonalDocumentRAGUnit:
         chunk_scores = self.create_dummy_chunk_scores(document_configs)
 
         # Apply fair distribution
-        result_chunks = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
+        result_chunks, _ = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
 
         # Calculate total characters and document representation
         total_chars = sum(len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in result_chunks)
@@ -254,7 +257,7 @@ class TestPersonalDocumentRAGUnit:
         """Test edge cases for the fair distribution algorithm."""
 
         # Test case 1: Empty inputs
-        result_empty = await _apply_fair_document_distribution({}, [], GLOBAL_CHARACTER_LIMIT)
+        result_empty, _ = await _apply_fair_document_distribution({}, [], GLOBAL_CHARACTER_LIMIT)
         assert result_empty == [], "Empty inputs should return empty list"
 
         # Test case 2: Single chunk per document
@@ -266,14 +269,17 @@ class TestPersonalDocumentRAGUnit:
         chunk_scores = self.create_dummy_chunk_scores(document_configs)
         document_uuids = ["doc-1", "doc-2", "doc-3"]
 
-        result_single = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
+        result_single, _ = await _apply_fair_document_distribution(chunk_scores, document_uuids, GLOBAL_CHARACTER_LIMIT)
 
         assert len(result_single) == 3, "Should include all chunks when well under limit"
 
         # Test case 3: Very small character limit
         small_limit = 5000  # Only enough for ~5 chunks
-        result_small_limit = await _apply_fair_document_distribution(chunk_scores, document_uuids, small_limit)
+        result_small_limit, total_chars_reported = await _apply_fair_document_distribution(
+            chunk_scores, document_uuids, small_limit
+        )
 
         total_chars_small = sum(len(chunk.get("_source", {}).get("chunk_content", "")) for chunk in result_small_limit)
         assert total_chars_small <= small_limit, "Should respect small character limit"
+        assert total_chars_reported == total_chars_small, "Should report the character count of the selected chunks"
         assert len(result_small_limit) >= 3, "Should still try to represent each document with small limit"
@@ -0,0 +1,157 @@
+"""
+Unit tests for the document upload utility functions.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from anthropic.types import ToolUseBlock
+
+from app.database.models import Document, DocumentChunk, MessageDocumentChunkMapping
+from app.document_upload.utils import (
+    _AUDIT_TASKS,
+    _QUERY_CACHE,
+    _persist_llm_audit,
+    _schedule_audit,
+    get_document_chunk_mappings,
+    rewrite_user_query,
+    wait_for_audit_tasks,
+)
+
+pytestmark = [
+    pytest.mark.document_upload,
+    pytest.mark.unit,
+]
+
+
+@pytest.fixture
+def audit_db_session():
+    """
+    Stands in for the session of its own that audit rows are written in.
+    """
+    session = AsyncMock()
+
+    @asynccontextmanager
+    async def async_db_session():
+        yield session
+
+    with patch("app.document_upload.utils.async_db_session", async_db_session):
+        yield session
+
+
+def _scalars_result(rows):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+class TestGetDocumentChunkMappings:
+    async def test_mappings_keep_input_order_and_reuse_existing_chunks(self):
+        documents = [Document(id=1, name="first.pdf"), Document(id=2, name="second.pdf")]
+        # the lookup returns chunks in a different order to the OpenSearch hits
+        doc_chunks = [
+            DocumentChunk(id=20, id_opensearch="b", document=documents[1]),
+            DocumentChunk(id=10, id_opensearch="a", document=documents[0]),
+        ]
+        hits = [
+            {"_id": "a", "_score": 3.0},
+            {"_id": "missing", "_score": 2.5},
+            {"_id": "b", "_score": 2.0},
+            {"_id": "a", "_score": 1.0},
+        ]
+        mappings = [
+            MessageDocumentChunkMapping(id=i, document_chunk_id=chunk_id) for i, chunk_id in enumerate([10, 20, 10])
+        ]
+        session = AsyncMock()
+        session.execute.side_effect = [_scalars_result(doc_chunks), _scalars_result(mappings)]
+
+        results = await get_document_chunk_mappings(hits, MagicMock(), message_id=7, session=session, use_chunk=True)
+
+        # one lookup for every chunk and one insert of the mappings, with no chunk rows written
+        assert session.execute.await_count == 2
+        insert_statement, mapping_rows = session.execute.await_args_list[1].args
+        assert insert_statement.table.name == MessageDocumentChunkMapping.__tablename__
+        assert mapping_rows == [
+            {"message_id": 7, "document_chunk_id": 10, "opensearch_score": 3.0, "use_document_chunk": True},
+            {"message_id": 7, "document_chunk_id": 20, "opensearch_score": 2.0, "use_document_chunk": True},
+            {"message_id": 7, "document_chunk_id": 10, "opensearch_score": 1.0, "use_document_chunk": True},
+        ]
+        assert [result.document_chunk for result in results] == [doc_chunks[1], doc_chunks[0], doc_chunks[1]]
+        assert [result.document for result in results] == [documents[0], documents[1], documents[0]]
+        assert [result.message_document_chunk_mapping for result in results] == mappings
+
+    async def test_no_chunks_skips_the_database(self):
+        session = AsyncMock()
+
+        assert await get_document_chunk_mappings([], MagicMock(), message_id=7, session=session) == []
+        session.execute.assert_not_awaited()
+
+
+class TestAuditTasks:
+    async def test_failing_audit_insert_is_logged_and_not_raised(self, audit_db_session, caplog):
+        response = MagicMock()
+        response.usage = MagicMock(input_tokens=10, output_tokens=5)
+
+        with (
+            patch(
+                "app.document_upload.utils.DbOperations.insert_llm_internal_response_id_query",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("database unavailable"),
+            ),
+            caplog.at_level(logging.ERROR, logger="app.document_upload.utils"),
+        ):
+            llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
+            task = _schedule_audit(_persist_llm_audit(llm, response, 1, 2, ["query"]))
+            await wait_for_audit_tasks()
+
+        assert task.done()
+        assert task not in _AUDIT_TASKS
+        assert "Failed to record rewritten queries" in caplog.text
+        assert "database unavailable" in caplog.text
+
+
+class TestRewriteUserQuery:
+    @pytest.fixture(autouse=True)
+    def clear_query_cache(self):
+        _QUERY_CACHE.clear()
+        yield
+        _QUERY_CACHE.clear()
+
+    async def test_repeated_query_skips_the_llm_and_still_records_its_queries(self, audit_db_session):
+        llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002, max_tokens=1000)
+        db_session = AsyncMock()
+        db_session.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=llm))
+        response = MagicMock()
+        response.content = [
+            ToolUseBlock(
+                id="tool-1", name="generate_queries", input={"keyword_queries": ["vat rates"]}, type="tool_use"
+            )
+        ]
+        response.usage = MagicMock(input_tokens=10, output_tokens=5)
+        index = MagicMock(id=3)
+
+        with (
+            patch("app.document_upload.utils.BedrockHandler") as mock_bedrock,
+            patch(
+                "app.document_upload.utils.DbOperations.insert_llm_internal_response_id_query",
+                new_callable=AsyncMock,
+                return_value=MagicMock(id=11),
+            ) as mock_insert_llm_response,
+        ):
+            mock_bedrock.return_value.invoke_async = AsyncMock(return_value=response)
+
+            first = await rewrite_user_query("What are VAT rates?", index, message_id=1, db_session=db_session)
+            second = await rewrite_user_query("What are VAT rates?", index, message_id=2, db_session=db_session)
+            await wait_for_audit_tasks()
+
+        assert first == second == ["vat rates"]
+        mock_bedrock.return_value.invoke_async.assert_awaited_once()
+        mock_insert_llm_response.assert_awaited_once()
+        assert not _AUDIT_TASKS
+        recorded_queries = [call.args[1] for call in audit_db_session.execute.await_args_list]
+        assert recorded_queries == [
+            [{"search_index_id": 3, "message_id": 1, "llm_internal_response_id": 11, "content": "vat rates"}],
+            [{"search_index_id": 3, "message_id": 2, "llm_internal_response_id": 11, "content": "vat rates"}],
+        ]
@@ -0,0 +1,30 @@
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from app.exceptions.handlers import CLIENT_ERROR_STATUS_CODES, DEFAULT_ERROR_STATUS_CODE, client_error_handler
+
+pytestmark = [pytest.mark.unit]
+
+
+class TestClientErrorHandler:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("exception_class", "status_code"),
+        list(CLIENT_ERROR_STATUS_CODES.items()),
+        ids=[exception_class.__name__ for exception_class in CLIENT_ERROR_STATUS_CODES],
+    )
+    async def test_subclass_resolves_to_the_parent_status_code(self, exception_class, status_code):
+        subclass = type(f"Custom{exception_class.__name__}", (exception_class,), {})
+
+        response = await client_error_handler(MagicMock(), subclass("something went wrong"))
+
+        assert response.status_code == status_code
+        assert orjson.loads(response.body) == {"detail": "something went wrong"}
+
+    @pytest.mark.asyncio
+    async def test_unmapped_exception_falls_back_to_the_default_status_code(self):
+        response = await client_error_handler(MagicMock(), ValueError("something went wrong"))
+
+        assert response.status_code == DEFAULT_ERROR_STATUS_CODE
@@ -0,0 +1,101 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.feedback.routes import (
+    _FEEDBACK_LABELS_CACHE,
+    _MESSAGE_RESPONSE_CACHE,
+    message_feedback_labels,
+    message_validator,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+def _make_message(message_uuid):
+    message = MagicMock()
+    message.client_response.return_value = {
+        "uuid": message_uuid,
+        "created_at": datetime.now(),
+        "content": "hello",
+        "role": "user",
+        "interrupted": False,
+        "citation": "",
+    }
+    return message
+
+
+class TestMessageValidator:
+    @pytest.fixture(autouse=True)
+    def clear_message_response_cache(self):
+        _MESSAGE_RESPONSE_CACHE.clear()
+        yield
+        _MESSAGE_RESPONSE_CACHE.clear()
+
+    async def test_repeated_lookup_skips_the_database(self):
+        message_uuid = uuid4()
+
+        with patch(
+            "app.feedback.routes.DbOperations.get_message_by_uuid",
+            new_callable=AsyncMock,
+            return_value=_make_message(message_uuid),
+        ) as mock_get_message:
+            first = await message_validator(str(message_uuid), db_session=AsyncMock())
+            second = await message_validator(str(message_uuid), db_session=AsyncMock())
+
+        mock_get_message.assert_awaited_once()
+        assert first == second
+        assert first.uuid == message_uuid
+
+    async def test_missing_message_is_not_cached(self):
+        message_uuid = uuid4()
+
+        with patch(
+            "app.feedback.routes.DbOperations.get_message_by_uuid",
+            new_callable=AsyncMock,
+            side_effect=[None, _make_message(message_uuid)],
+        ) as mock_get_message:
+            with pytest.raises(HTTPException) as exc_info:
+                await message_validator(str(message_uuid), db_session=AsyncMock())
+            # the message is created after the first lookup
+            message = await message_validator(str(message_uuid), db_session=AsyncMock())
+
+        assert exc_info.value.status_code == 400
+        assert mock_get_message.await_count == 2
+        assert message.uuid == message_uuid
+
+
+class TestMessageFeedbackLabels:
+    @pytest.fixture(autouse=True)
+    def clear_feedback_labels_cache(self):
+        _FEEDBACK_LABELS_CACHE.clear()
+        yield
+        _FEEDBACK_LABELS_CACHE.clear()
+
+    async def test_labels_are_read_from_the_database_once(self):
+        label = MagicMock()
+        label.client_response.return_value = {"uuid": uuid4(), "created_at": datetime.now(), "label": "Inaccurate"}
+        db_session = AsyncMock()
+
+        @asynccontextmanager
+        async def async_db_session():
+            yield db_session
+
+        with (
+            patch("app.feedback.routes.async_db_session", async_db_session),
+            patch(
+                "app.feedback.routes.DbOperations.get_message_feedback_labels_list",
+                new_callable=AsyncMock,
+                return_value=[label],
+            ) as mock_get_labels,
+        ):
+            first = await message_feedback_labels()
+            second = await message_feedback_labels()
+
+        mock_get_labels.assert_awaited_once()
+        assert [feedback_label.label for feedback_label in first] == ["Inaccurate"]
+        assert second == first
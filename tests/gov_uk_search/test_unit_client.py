@@ -0,0 +1,116 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from app.gov_uk_search.client import (
+    _CONTENT_CACHE,
+    _CONTENT_NOT_FOUND,
+    ContentApiCircuitBreaker,
+    GovUKContent,
+    GovUKHttpSession,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+class TestGetContentsBulk:
+    @pytest.mark.asyncio
+    async def test_returns_content_in_path_order_with_empty_dict_for_failures(self):
+        async def fake_get_content(path):
+            if path == "broken":
+                raise RuntimeError("connection reset")
+            return {"base_path": f"/{path}"}
+
+        with patch.object(GovUKContent, "get_content", side_effect=fake_get_content):
+            result = await GovUKContent.get_contents_bulk(["help/cookies", "broken", "help/about"])
+
+        assert result == [{"base_path": "/help/cookies"}, {}, {"base_path": "/help/about"}]
+
+
+class TestGetContentCache:
+    @pytest.fixture(autouse=True)
+    def clear_content_cache(self):
+        _CONTENT_CACHE.clear()
+        _CONTENT_NOT_FOUND.clear()
+        yield
+        _CONTENT_CACHE.clear()
+        _CONTENT_NOT_FOUND.clear()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_and_repeated_requests_share_one_fetch(self):
+        fetch = AsyncMock(return_value={"base_path": "/help/cookies"})
+
+        with patch.object(GovUKContent, "_fetch_content", fetch):
+            first, second = await asyncio.gather(
+                GovUKContent.get_content("help/cookies"), GovUKContent.get_content("/help/cookies")
+            )
+            third = await GovUKContent.get_content("help/cookies")
+
+        assert first == second == third == {"base_path": "/help/cookies"}
+        fetch.assert_awaited_once_with("help/cookies")
+
+    @pytest.mark.asyncio
+    async def test_failed_responses_are_not_cached(self):
+        fetch = AsyncMock(return_value={})
+
+        with patch.object(GovUKContent, "_fetch_content", fetch):
+            await GovUKContent.get_content("missing")
+            await GovUKContent.get_content("missing")
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_recently_missing_paths_skip_the_request(self):
+        _CONTENT_NOT_FOUND["missing"] = True
+        fetch = AsyncMock(return_value={"base_path": "/missing"})
+
+        with patch.object(GovUKContent, "_fetch_content", fetch):
+            assert await GovUKContent.get_content("/missing") == {}
+
+        fetch.assert_not_awaited()
+
+
+class TestContentApiCircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def reset_circuit_breaker(self):
+        ContentApiCircuitBreaker._failures = 0
+        ContentApiCircuitBreaker._open_until = 0.0
+        yield
+        ContentApiCircuitBreaker._failures = 0
+        ContentApiCircuitBreaker._open_until = 0.0
+
+    def test_opens_after_consecutive_failures_only(self):
+        for _ in range(ContentApiCircuitBreaker.FAILURE_THRESHOLD - 1):
+            ContentApiCircuitBreaker.record_failure()
+        ContentApiCircuitBreaker.record_success()
+        ContentApiCircuitBreaker.record_failure()
+        assert not ContentApiCircuitBreaker.is_open()
+
+        for _ in range(ContentApiCircuitBreaker.FAILURE_THRESHOLD - 1):
+            ContentApiCircuitBreaker.record_failure()
+        assert ContentApiCircuitBreaker.is_open()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_the_request(self):
+        for _ in range(ContentApiCircuitBreaker.FAILURE_THRESHOLD):
+            ContentApiCircuitBreaker.record_failure()
+
+        with patch.object(GovUKHttpSession, "get") as get_session:
+            result = await GovUKContent._fetch_content("help/cookies")
+
+        assert result == {}
+        get_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [aiohttp.ClientConnectionError("connection reset"), asyncio.TimeoutError()])
+    async def test_request_error_returns_empty_content_and_counts_a_failure(self, error):
+        session = MagicMock()
+        session.get.return_value.__aenter__.side_effect = error
+
+        with patch.object(GovUKHttpSession, "get", return_value=session):
+            result = await GovUKContent._fetch_content("help/cookies")
+
+        assert result == {}
+        assert ContentApiCircuitBreaker._failures == 1
@@ -1,17 +1,42 @@
-from decimal import Decimal
+import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.gov_uk_search.schemas import SearchCandidate
 from app.gov_uk_search.service import (
-    assess_document_relevancy,
+    EXTRACTED_CONTENT_CACHE,
+    EXTRACTED_CONTENT_FAILURE_CACHE,
+    RELEVANCY_ASSESSMENT_CACHE,
+    SEARCH_QUERIES_CACHE,
+    _content_for_relevancy_assessment,
+    _deduplicate_search_terms,
+    assess_documents_relevancy,
     assess_if_next_message_should_use_gov_uk_search,
+    extract_content_from_gov_uk,
+    extract_urls_from_user_prompt,
     get_search_queries,
 )
 
 pytestmark = [pytest.mark.unit]
 
 
+@pytest.fixture(autouse=True)
+def committed_llm_session():
+    """
+    Stands in for the separate session that LLM calls with cached results are recorded and committed in.
+    """
+    session = AsyncMock()
+
+    @asynccontextmanager
+    async def async_db_session():
+        yield session
+
+    with patch("app.gov_uk_search.service.async_db_session", async_db_session):
+        yield session
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -39,6 +64,25 @@ def _make_tool_use_response(tool_name, input_data, tokens_in=10, tokens_out=5):
     return response
 
 
+def _make_candidate(title, description, full_content):
+    return SearchCandidate(
+        title=title,
+        description=description,
+        link="https://www.gov.uk/page",
+        query_id=1,
+        position=1,
+        full_content=full_content,
+    )
+
+
+def _make_batch_relevancy_response(assessments, tokens_in=10, tokens_out=5):
+    response = _make_tool_use_response(
+        "assess_documents_relevance", {"assessments": assessments}, tokens_in=tokens_in, tokens_out=tokens_out
+    )
+    response.dict.return_value = {"content": [{"type": "tool_use", "input": {"assessments": assessments}}]}
+    return response
+
+
 def _make_text_response(text="I cannot use a tool", tokens_in=10, tokens_out=5):
     block = MagicMock()
     block.type = "text"
@@ -138,6 +182,71 @@ class TestAssessIfNextMessageShouldUseGovUkSearch:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_empty_message_does_not_call_llm(self):
+        db_session = AsyncMock()
+
+        with patch("app.gov_uk_search.service.BedrockHandler") as mock_bedrock:
+            result = await assess_if_next_message_should_use_gov_uk_search(
+                messages=[_make_message(msg_id=1)],
+                new_user_message_content="   ",
+                new_user_message_id=42,
+                db_session=db_session,
+            )
+
+        assert result is False
+        mock_bedrock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_explicit_search_request_does_not_call_llm(self):
+        db_session = AsyncMock()
+
+        with patch("app.gov_uk_search.service.BedrockHandler") as mock_bedrock:
+            result = await assess_if_next_message_should_use_gov_uk_search(
+                messages=[_make_message(msg_id=1)],
+                new_user_message_content="Can you search GOV.UK for the latest guidance?",
+                new_user_message_id=42,
+                db_session=db_session,
+            )
+
+        assert result is True
+        mock_bedrock.assert_not_called()
+        db_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_negated_search_request_calls_llm(self):
+        db_session = AsyncMock()
+        db_session.execute = AsyncMock(return_value=MagicMock(fetchall=MagicMock(return_value=[])))
+
+        llm_response = _make_tool_use_response(
+            "assess_if_gov_uk_search_should_be_used",
+            {"use_gov_uk_search": False},
+        )
+
+        with (
+            patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
+            patch("app.gov_uk_search.service.BedrockHandler") as mock_bedrock,
+            patch(
+                "app.gov_uk_search.service.DbOperations.insert_llm_internal_response_id_query", new_callable=AsyncMock
+            ) as mock_insert,
+        ):
+            mock_llm_table.return_value.get_by_model.return_value = MagicMock()
+            mock_bedrock_instance = MagicMock()
+            mock_bedrock_instance.invoke_async = AsyncMock(return_value=llm_response)
+            mock_bedrock_instance.llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
+            mock_bedrock.return_value = mock_bedrock_instance
+            mock_insert.return_value = MagicMock(id=99)
+
+            result = await assess_if_next_message_should_use_gov_uk_search(
+                messages=[_make_message(msg_id=1)],
+                new_user_message_content="Don't search GOV.UK, just shorten this",
+                new_user_message_id=42,
+                db_session=db_session,
+            )
+
+        assert result is False
+        mock_bedrock_instance.invoke_async.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_returns_false_on_llm_error(self):
         db_session = AsyncMock()
@@ -316,6 +425,12 @@ class TestAssessIfNextMessageShouldUseGovUkSearch:
 
 
 class TestGetSearchQueries:
+    @pytest.fixture(autouse=True)
+    def clear_search_queries_cache(self):
+        SEARCH_QUERIES_CACHE.clear()
+        yield
+        SEARCH_QUERIES_CACHE.clear()
+
     @pytest.mark.asyncio
     async def test_returns_search_terms_from_tool_call(self):
         db_session = AsyncMock()
@@ -356,7 +471,7 @@ class TestGetSearchQueries:
 
         assert set(search_terms) == {"cycling safety", "bike lanes uk"}
         assert llm_id == 7
-        assert isinstance(cost, Decimal)
+        assert isinstance(cost, float)
 
     @pytest.mark.asyncio
     async def test_returns_empty_terms_on_no_tool_call(self):
@@ -498,22 +613,101 @@ class TestGetSearchQueries:
         combined_content = " ".join(m["content"] for m in captured_messages)
         assert "<recent-conversation>" not in combined_content
 
+    @pytest.mark.asyncio
+    async def test_rephrased_standalone_query_reuses_cached_terms(self, committed_llm_session):
+        db_session = AsyncMock()
+
+        response = MagicMock()
+        response.content = [MagicMock(type="tool_use", input={"search_terms": ["vat rates"]})]
+        response.usage = MagicMock(input_tokens=20, output_tokens=10)
+        response.dict.return_value = {
+            "content": [{"type": "tool_use", "input": {"search_terms": ["vat rates"], "count": 5}}],
+            "stop_reason": "tool_use",
+        }
+
+        with (
+            patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
+            patch("app.gov_uk_search.service.BedrockHandler") as mock_bedrock,
+            patch(
+                "app.gov_uk_search.service.DbOperations.insert_llm_internal_response_id_query", new_callable=AsyncMock
+            ) as mock_insert,
+        ):
+            mock_llm_table.return_value.get_by_model.return_value = MagicMock()
+            mock_bedrock_instance = MagicMock()
+            mock_bedrock_instance.invoke_async = AsyncMock(return_value=response)
+            mock_bedrock_instance.llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
+            mock_bedrock.return_value = mock_bedrock_instance
+            mock_insert.return_value = MagicMock(id=7)
+
+            first = await get_search_queries(role="user", query="What are VAT rates?", db_session=db_session)
+            second = await get_search_queries(role="user", query="what are  VAT rates", db_session=db_session)
+
+        mock_bedrock_instance.invoke_async.assert_awaited_once()
+        assert mock_insert.await_args.kwargs["db_session"] is committed_llm_session
+        assert second == (["vat rates"], 7, {"count": 5}, 0.0)
+        assert first[:3] == second[:3]
+
+    def test_deduplicate_search_terms_keeps_first_occurrence_in_order(self):
+        terms = ["UK VAT rates", "cycling safety", "vat  rates uk", "Cycling Safety", "bike lanes"]
+
+        assert _deduplicate_search_terms(terms) == ["UK VAT rates", "cycling safety", "bike lanes"]
+
 
 # ---------------------------------------------------------------------------
-# assess_document_relevancy
+# _content_for_relevancy_assessment
 # ---------------------------------------------------------------------------
 
 
-class TestAssessDocumentRelevancy:
-    @pytest.mark.asyncio
-    async def test_returns_true_for_relevant_document(self):
-        db_session = AsyncMock()
+class TestContentForRelevancyAssessment:
+    def test_long_content_is_truncated(self):
+        excerpt = _content_for_relevancy_assessment("short description", "x" * 20000)
 
-        llm_response = _make_tool_use_response("assess_document_relevance", {"is_relevant": True})
-        llm_response.dict.return_value = {"content": [{"type": "tool_use", "input": {"is_relevant": True}}]}
+        assert "x" * 7000 not in excerpt
+        assert excerpt.endswith("[content truncated]")
+
+    def test_non_ascii_content_is_truncated_by_bytes(self):
+        ascii_excerpt = _content_for_relevancy_assessment("summary", "x" * 20000)
+        welsh_excerpt = _content_for_relevancy_assessment("summary", "ŵ" * 20000)
+
+        assert welsh_excerpt.endswith("[content truncated]")
+        assert len(welsh_excerpt.encode()) <= len(ascii_excerpt.encode())
+        assert welsh_excerpt.count("ŵ") < ascii_excerpt.count("x")
+
+    def test_page_furniture_and_repeated_lines_are_left_out(self):
+        full_content = "\n\n".join(
+            ["# VAT rates", "Contents", "Rates on goods", "Standard rate is 20%.", "Related content", "Rates on goods"]
+        )
+
+        excerpt = _content_for_relevancy_assessment("VAT rates for businesses", full_content)
+
+        assert excerpt == (
+            "VAT rates for businesses\n\nContent excerpt:\n# VAT rates\n\nRates on goods\n\nStandard rate is 20%.\n"
+        )
+
+
+# ---------------------------------------------------------------------------
+# assess_documents_relevancy
+# ---------------------------------------------------------------------------
 
-        mock_llm_internal = MagicMock()
-        mock_llm_internal.id = 5
+
+class TestAssessDocumentsRelevancy:
+    @pytest.fixture(autouse=True)
+    def clear_relevancy_assessment_cache(self):
+        RELEVANCY_ASSESSMENT_CACHE.clear()
+        yield
+        RELEVANCY_ASSESSMENT_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_documents_are_assessed_in_batches_and_returned_in_order(self):
+        documents = [_make_candidate(f"Page {i}", f"Description {i}", f"Content {i}") for i in range(8)]
+
+        def batch_response(messages, **kwargs):
+            # the first batch marks its even pages relevant, the second batch marks everything relevant
+            page_count = messages[0]["content"].count("<retrieved-gov-uk-page index=")
+            assessments = [{"index": i, "is_relevant": page_count == 2 or i % 2 == 1} for i in range(1, page_count + 1)]
+            response = _make_tool_use_response("assess_documents_relevance", {"assessments": assessments})
+            response.dict.return_value = {"content": [{"type": "tool_use", "input": {"assessments": assessments}}]}
+            return response
 
         with (
             patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
@@ -522,37 +716,29 @@ class TestAssessDocumentRelevancy:
                 "app.gov_uk_search.service.DbOperations.insert_llm_internal_response_id_query", new_callable=AsyncMock
             ) as mock_insert,
         ):
-            mock_llm_table.return_value.get_by_model.return_value = MagicMock(
-                input_cost_per_token=0.001, output_cost_per_token=0.002
-            )
+            mock_llm_table.return_value.get_by_model.return_value = MagicMock()
             mock_bedrock_instance = MagicMock()
-            mock_bedrock_instance.invoke_async = AsyncMock(return_value=llm_response)
+            mock_bedrock_instance.invoke_async = AsyncMock(side_effect=batch_response)
             mock_bedrock_instance.llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
             mock_bedrock.return_value = mock_bedrock_instance
-            mock_insert.return_value = mock_llm_internal
+            mock_insert.return_value = MagicMock(id=3)
 
-            is_relevant, cost, llm_id = await assess_document_relevancy(
-                role="user",
-                query="cycling safety",
-                title="Cycling Safety Guide",
-                description="A guide to cycling safety on UK roads",
-                full_content="Full content about cycling on UK roads...",
-                db_session=db_session,
-            )
+            assessments = await assess_documents_relevancy(role="user", query="cycling safety", documents=documents)
 
-        assert is_relevant is True
-        assert isinstance(cost, Decimal)
-        assert llm_id == 5
+        assert mock_bedrock_instance.invoke_async.await_count == 2
+        assert [is_relevant for is_relevant, _, _ in assessments] == [True, False, True, False, True, False, True, True]
+        assert sum(cost for _, cost, _ in assessments) == pytest.approx(2 * (10 * 0.001 + 5 * 0.002))
+        assert all(llm_id == 3 for _, _, llm_id in assessments)
 
     @pytest.mark.asyncio
-    async def test_returns_false_for_irrelevant_document(self):
-        db_session = AsyncMock()
+    async def test_documents_are_split_into_batches_of_six(self):
+        documents = [_make_candidate(f"Page {i}", f"Description {i}", f"Content {i}") for i in range(13)]
+        batch_sizes = []
 
-        llm_response = _make_tool_use_response("assess_document_relevance", {"is_relevant": False})
-        llm_response.dict.return_value = {"content": [{"type": "tool_use", "input": {"is_relevant": False}}]}
-
-        mock_llm_internal = MagicMock()
-        mock_llm_internal.id = 5
+        def batch_response(messages, **kwargs):
+            page_count = messages[0]["content"].count("<retrieved-gov-uk-page index=")
+            batch_sizes.append(page_count)
+            return _make_batch_relevancy_response([{"index": i, "is_relevant": True} for i in range(1, page_count + 1)])
 
         with (
             patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
@@ -561,39 +747,52 @@ class TestAssessDocumentRelevancy:
                 "app.gov_uk_search.service.DbOperations.insert_llm_internal_response_id_query", new_callable=AsyncMock
             ) as mock_insert,
         ):
-            mock_llm_table.return_value.get_by_model.return_value = MagicMock(
-                input_cost_per_token=0.001, output_cost_per_token=0.002
-            )
+            mock_llm_table.return_value.get_by_model.return_value = MagicMock()
             mock_bedrock_instance = MagicMock()
-            mock_bedrock_instance.invoke_async = AsyncMock(return_value=llm_response)
+            mock_bedrock_instance.invoke_async = AsyncMock(side_effect=batch_response)
             mock_bedrock_instance.llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
             mock_bedrock.return_value = mock_bedrock_instance
-            mock_insert.return_value = mock_llm_internal
+            mock_insert.return_value = MagicMock(id=3)
 
-            is_relevant, cost, _ = await assess_document_relevancy(
-                role="user",
-                query="cycling safety",
-                title="Login Page",
-                description="Please log in to continue",
-                full_content="Username: Password:",
-                db_session=db_session,
-            )
+            assessments = await assess_documents_relevancy(role="user", query="test", documents=documents)
 
-        assert is_relevant is False
+        assert sorted(batch_sizes) == [1, 6, 6]
+        assert len(assessments) == 13
+        assert all(is_relevant for is_relevant, _, _ in assessments)
 
     @pytest.mark.asyncio
     async def test_tool_choice_is_forced(self):
-        """invoke_async must be called with tool_choice forcing the assess_document_relevance tool."""
-        db_session = AsyncMock()
+        """invoke_async must be called with tool_choice forcing the assess_documents_relevance tool."""
+        documents = [_make_candidate("Some Page", "Some description", "Some content")]
 
-        llm_response = _make_tool_use_response("assess_document_relevance", {"is_relevant": True})
-        llm_response.dict.return_value = {"content": [{"type": "tool_use", "input": {"is_relevant": True}}]}
+        with (
+            patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
+            patch("app.gov_uk_search.service.BedrockHandler") as mock_bedrock,
+            patch(
+                "app.gov_uk_search.service.DbOperations.insert_llm_internal_response_id_query", new_callable=AsyncMock
+            ) as mock_insert,
+        ):
+            mock_llm_table.return_value.get_by_model.return_value = MagicMock()
+            mock_bedrock_instance = MagicMock()
+            mock_bedrock_instance.invoke_async = AsyncMock(
+                return_value=_make_batch_relevancy_response([{"index": 1, "is_relevant": True}])
+            )
+            mock_bedrock_instance.llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
+            mock_bedrock.return_value = mock_bedrock_instance
+            mock_insert.return_value = MagicMock(id=1)
 
-        captured_kwargs = {}
+            await assess_documents_relevancy(role="user", query="test query", documents=documents)
 
-        async def capture_invoke(messages, **kwargs):
-            captured_kwargs.update(kwargs)
-            return llm_response
+        tool_choice = mock_bedrock_instance.invoke_async.await_args.kwargs["tool_choice"]
+        assert tool_choice == {"type": "tool", "name": "assess_documents_relevance"}
+
+    @pytest.mark.asyncio
+    async def test_cached_assessment_skips_bedrock(self):
+        documents = [
+            _make_candidate(
+                "Cycling Safety Guide", "A guide to cycling safety on UK roads", "Full content about cycling..."
+            )
+        ]
 
         with (
             patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
@@ -602,95 +801,191 @@ class TestAssessDocumentRelevancy:
                 "app.gov_uk_search.service.DbOperations.insert_llm_internal_response_id_query", new_callable=AsyncMock
             ) as mock_insert,
         ):
-            mock_llm_table.return_value.get_by_model.return_value = MagicMock(
-                input_cost_per_token=0.001, output_cost_per_token=0.002
+            mock_llm_table.return_value.get_by_model.return_value = MagicMock()
+            mock_bedrock_instance = MagicMock()
+            mock_bedrock_instance.invoke_async = AsyncMock(
+                return_value=_make_batch_relevancy_response([{"index": 1, "is_relevant": True}])
             )
+            mock_bedrock_instance.llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
+            mock_bedrock.return_value = mock_bedrock_instance
+            mock_insert.return_value = MagicMock(id=5)
+
+            first = await assess_documents_relevancy(role="user", query="cycling safety", documents=documents)
+            second = await assess_documents_relevancy(role="user", query="Cycling  safety?", documents=documents)
+
+        mock_bedrock_instance.invoke_async.assert_awaited_once()
+        mock_insert.assert_awaited_once()
+        assert first[0][0] is True
+        assert second == [(True, 0.0, 5)]
+
+    @pytest.mark.asyncio
+    async def test_llm_call_is_recorded_in_its_own_session_before_caching(self, committed_llm_session):
+        documents = [_make_candidate("Page", "Description", "Content")]
+        assessments = [{"index": 1, "is_relevant": True}]
+        llm_response = _make_tool_use_response("assess_documents_relevance", {"assessments": assessments})
+        llm_response.dict.return_value = {"content": [{"type": "tool_use", "input": {"assessments": assessments}}]}
+
+        with (
+            patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
+            patch("app.gov_uk_search.service.BedrockHandler") as mock_bedrock,
+            patch(
+                "app.gov_uk_search.service.DbOperations.insert_llm_internal_response_id_query", new_callable=AsyncMock
+            ) as mock_insert,
+        ):
+            mock_llm_table.return_value.get_by_model.return_value = MagicMock()
             mock_bedrock_instance = MagicMock()
-            mock_bedrock_instance.invoke_async = capture_invoke
+            mock_bedrock_instance.invoke_async = AsyncMock(return_value=llm_response)
             mock_bedrock_instance.llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
             mock_bedrock.return_value = mock_bedrock_instance
-            mock_insert.return_value = MagicMock(id=1)
+            mock_insert.return_value = MagicMock(id=3)
 
-            await assess_document_relevancy(
-                role="user",
-                query="test query",
-                title="Some Page",
-                description="Some description",
-                full_content="Some content",
-                db_session=db_session,
-            )
+            await assess_documents_relevancy(role="user", query="test", documents=documents)
 
-        assert "tool_choice" in captured_kwargs
-        assert captured_kwargs["tool_choice"]["type"] == "tool"
-        assert captured_kwargs["tool_choice"]["name"] == "assess_document_relevance"
+        assert mock_insert.await_args.kwargs["db_session"] is committed_llm_session
+        assert list(RELEVANCY_ASSESSMENT_CACHE.values()) == [(True, 3)]
 
     @pytest.mark.asyncio
-    async def test_returns_false_on_llm_error(self):
-        db_session = AsyncMock()
+    async def test_document_missing_from_llm_answer_is_not_cached(self):
+        documents = [_make_candidate(f"Page {i}", f"Description {i}", f"Content {i}") for i in range(2)]
+        assessments = [{"index": 1, "is_relevant": True}]
+        llm_response = _make_tool_use_response("assess_documents_relevance", {"assessments": assessments})
+        llm_response.dict.return_value = {"content": [{"type": "tool_use", "input": {"assessments": assessments}}]}
 
         with (
             patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
             patch("app.gov_uk_search.service.BedrockHandler") as mock_bedrock,
+            patch(
+                "app.gov_uk_search.service.DbOperations.insert_llm_internal_response_id_query", new_callable=AsyncMock
+            ) as mock_insert,
         ):
             mock_llm_table.return_value.get_by_model.return_value = MagicMock()
             mock_bedrock_instance = MagicMock()
-            mock_bedrock_instance.invoke_async = AsyncMock(side_effect=Exception("Bedrock timeout"))
+            mock_bedrock_instance.invoke_async = AsyncMock(return_value=llm_response)
+            mock_bedrock_instance.llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
             mock_bedrock.return_value = mock_bedrock_instance
+            mock_insert.return_value = MagicMock(id=3)
 
-            is_relevant, cost, llm_id = await assess_document_relevancy(
-                role="user",
-                query="test",
-                title="Some Page",
-                description="description",
-                full_content="content",
-                db_session=db_session,
-            )
+            results = await assess_documents_relevancy(role="user", query="test", documents=documents)
 
-        assert is_relevant is False
-        assert cost == Decimal(0)
-        assert llm_id == 0
+        assert [is_relevant for is_relevant, _, _ in results] == [True, False]
+        assert list(RELEVANCY_ASSESSMENT_CACHE.values()) == [(True, 3)]
 
     @pytest.mark.asyncio
-    async def test_content_is_truncated_to_6000_chars(self):
-        """Full content longer than 6000 chars should be truncated before sending."""
-        db_session = AsyncMock()
+    async def test_failed_batch_marks_its_documents_irrelevant(self):
+        documents = [_make_candidate("Page", "Description", "Content")]
+
+        with (
+            patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
+            patch("app.gov_uk_search.service.BedrockHandler") as mock_bedrock,
+        ):
+            mock_llm_table.return_value.get_by_model.return_value = MagicMock()
+            mock_bedrock_instance = MagicMock()
+            mock_bedrock_instance.invoke_async = AsyncMock(side_effect=Exception("Bedrock timeout"))
+            mock_bedrock.return_value = mock_bedrock_instance
 
-        llm_response = _make_tool_use_response("assess_document_relevance", {"is_relevant": True})
-        llm_response.dict.return_value = {"content": [{"type": "tool_use", "input": {"is_relevant": True}}]}
+            assessments = await assess_documents_relevancy(role="user", query="test", documents=documents)
 
-        captured_messages = []
+        assert assessments == [(False, 0.0, 0)]
 
-        async def capture_invoke(messages, **kwargs):
-            captured_messages.extend(messages)
-            return llm_response
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_are_limited(self):
+        documents = [_make_candidate(f"Page {i}", f"Description {i}", f"Content {i}") for i in range(5)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def batch_response(messages, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            assessments = [{"index": 1, "is_relevant": True}]
+            response = _make_tool_use_response("assess_documents_relevance", {"assessments": assessments})
+            response.dict.return_value = {"content": [{"type": "tool_use", "input": {"assessments": assessments}}]}
+            return response
 
         with (
+            patch("app.gov_uk_search.service.RELEVANCY_ASSESSMENT_BATCH_SIZE", 1),
+            patch("app.gov_uk_search.service.RELEVANCY_ASSESSMENT_CONCURRENCY", 2),
             patch("app.gov_uk_search.service.LLMTable") as mock_llm_table,
             patch("app.gov_uk_search.service.BedrockHandler") as mock_bedrock,
             patch(
                 "app.gov_uk_search.service.DbOperations.insert_llm_internal_response_id_query", new_callable=AsyncMock
             ) as mock_insert,
         ):
-            mock_llm_table.return_value.get_by_model.return_value = MagicMock(
-                input_cost_per_token=0.001, output_cost_per_token=0.002
-            )
+            mock_llm_table.return_value.get_by_model.return_value = MagicMock()
             mock_bedrock_instance = MagicMock()
-            mock_bedrock_instance.invoke_async = capture_invoke
+            mock_bedrock_instance.invoke_async = batch_response
             mock_bedrock_instance.llm = MagicMock(input_cost_per_token=0.001, output_cost_per_token=0.002)
             mock_bedrock.return_value = mock_bedrock_instance
-            mock_insert.return_value = MagicMock(id=1)
+            mock_insert.return_value = MagicMock(id=3)
 
-            long_content = "x" * 20000
-            await assess_document_relevancy(
-                role="user",
-                query="test",
-                title="Page",
-                description="short description",
-                full_content=long_content,
-                db_session=db_session,
-            )
+            assessments = await assess_documents_relevancy(role="user", query="test", documents=documents)
 
-        combined_content = " ".join(m["content"] for m in captured_messages)
-        # 20000 chars of 'x' should not appear in full — truncated to ~6000
-        assert "x" * 7000 not in combined_content
-        assert "[content truncated]" in combined_content
+        assert max_in_flight == 2
+        assert all(is_relevant for is_relevant, _, _ in assessments)
+
+
+# ---------------------------------------------------------------------------
+# extract_urls_from_user_prompt
+# ---------------------------------------------------------------------------
+
+
+class TestExtractUrlsFromUserPrompt:
+    @pytest.mark.asyncio
+    async def test_urls_for_the_same_page_are_returned_once(self):
+        urls = [
+            "https://www.gov.uk/vat-rates",
+            "https://www.gov.uk/vat-rates/",
+            "www.gov.uk/vat-rates?utm_source=newsletter#rates",
+            "/vat-rates?id=2",
+            "https://www.gov.uk/vat-rates?id=2&gclid=abc",
+            "http://www.example.com/",
+        ]
+        llm = MagicMock()
+        llm.invoke_async = AsyncMock(return_value=MagicMock())
+        llm.invoke_async.return_value.dict.return_value = {"content": [{"type": "tool_use", "input": {"urls": urls}}]}
+
+        result = await extract_urls_from_user_prompt(llm=llm, role="user", query="summarise these pages")
+
+        assert result == [
+            "https://www.gov.uk/vat-rates",
+            "https://www.gov.uk/vat-rates?id=2",
+            "http://www.example.com/",
+        ]
+
+
+# ---------------------------------------------------------------------------
+# extract_content_from_gov_uk
+# ---------------------------------------------------------------------------
+
+
+class TestExtractContentFromGovUkCache:
+    @pytest.fixture(autouse=True)
+    def clear_extracted_content_caches(self):
+        EXTRACTED_CONTENT_CACHE.clear()
+        EXTRACTED_CONTENT_FAILURE_CACHE.clear()
+        yield
+        EXTRACTED_CONTENT_CACHE.clear()
+        EXTRACTED_CONTENT_FAILURE_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_urls_differing_only_by_query_share_a_cache_entry(self):
+        with patch(
+            "app.gov_uk_search.service._extract_content_from_gov_uk", new_callable=AsyncMock, return_value="# VAT rates"
+        ) as mock_extract:
+            first = await extract_content_from_gov_uk("https://www.gov.uk/vat-rates")
+            second = await extract_content_from_gov_uk("https://WWW.GOV.UK/vat-rates?utm_source=search#rates")
+
+        assert first == second == "# VAT rates"
+        mock_extract.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_extraction_is_not_retried_straight_away(self):
+        with patch(
+            "app.gov_uk_search.service._extract_content_from_gov_uk", new_callable=AsyncMock, return_value=""
+        ) as mock_extract:
+            assert await extract_content_from_gov_uk("https://www.gov.uk/missing") == ""
+            assert await extract_content_from_gov_uk("https://www.gov.uk/missing") == ""
+
+        mock_extract.assert_awaited_once()
@@ -0,0 +1,37 @@
+import pytest
+
+from app.gov_uk_search.utils import parse_gov_uk_html
+
+pytestmark = [pytest.mark.unit]
+
+
+class TestParseGovUkHtml:
+    def test_extracts_title_metadata_and_main_content_as_markdown(self):
+        html = """<!DOCTYPE html><html><body>
+            <div class="govuk-grid-column-two-thirds">
+                <h1 class="gem-c-title">VAT rates</h1>
+                <div class="gem-c-metadata"><dt>From:</dt> <dd>HM Revenue &amp; Customs</dd></div>
+                <p>Most goods are <strong>standard rated</strong>.</p>
+                <h2>Rates</h2>
+                <ul><li>Standard rate 20%</li><li> </li></ul>
+            </div>
+            <div id="footer"><p>Not included</p></div>
+        </body></html>"""
+
+        assert parse_gov_uk_html(html) == "\n".join(
+            [
+                "# VAT rates",
+                "",
+                "From: HM Revenue & Customs",
+                "",
+                "Most goods are standard rated.",
+                "",
+                "## Rates",
+                "",
+                "Standard rate 20%",
+                "",
+            ]
+        )
+
+    def test_empty_page_returns_empty_string(self):
+        assert parse_gov_uk_html(b"  ") == ""
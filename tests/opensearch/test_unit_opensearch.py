@@ -6,6 +6,7 @@ import pytest
 from dotenv import load_dotenv
 from opensearchpy import OpenSearch, RequestError
 
+from app.opensearch.serializer import OrjsonSerializer
 from app.opensearch.service import AsyncOpenSearchOperations, list_indexes
 
 load_dotenv()
@@ -458,3 +459,47 @@ class TestOpensearch:
             result = await AsyncOpenSearchOperations.get_multiple_document_chunks(index_name, document_uuids)
 
             assert result == []
+
+    @pytest.mark.asyncio
+    async def test_msearch_multiple_document_chunks_returns_hits_per_query(self):
+        """Test msearch_multiple_document_chunks sends one request and splits hits by query."""
+        document_uuids = ["doc-1", "doc-2"]
+        queries = ["first query", "second query", "failing query"]
+        index_name = "test_index"
+        max_size = 10
+
+        mock_response = {
+            "responses": [
+                {"hits": {"hits": [{"_id": "chunk-1", "_score": 1.0}, {"_id": "chunk-2", "_score": 0.5}]}},
+                {"hits": {"hits": [{"_id": "chunk-2", "_score": 0.8}]}},
+                {"error": {"type": "search_phase_execution_exception"}, "status": 400},
+            ]
+        }
+
+        with patch("app.opensearch.service.AsyncOpenSearchClient.get") as mock_client:
+            mock_msearch = AsyncMock()
+            mock_client.return_value.msearch = mock_msearch
+            mock_msearch.return_value = mock_response
+
+            result = await AsyncOpenSearchOperations.msearch_multiple_document_chunks(
+                document_uuids, queries, index_name, max_size
+            )
+
+            mock_msearch.assert_awaited_once()
+            search_body = mock_msearch.call_args.kwargs["body"]
+            assert search_body[0::2] == [{"index": index_name}] * len(queries)
+            assert [body["query"]["bool"]["must"][0]["multi_match"]["query"] for body in search_body[1::2]] == queries
+            assert all(body["size"] == max_size for body in search_body[1::2])
+
+            assert [[hit["_id"] for hit in hits] for hits in result] == [["chunk-1", "chunk-2"], ["chunk-2"], []]
+
+    def test_orjson_serializer_round_trips_search_bodies(self):
+        """Test the orjson serializer produces str output the OpenSearch transport can send and parse back."""
+        serializer = OrjsonSerializer()
+        body = {"query": {"match": {"chunk_content": "café"}}, "size": 5}
+
+        dumped = serializer.dumps(body)
+
+        assert isinstance(dumped, str)
+        assert serializer.loads(dumped) == body
+        assert serializer.dumps('{"already": "serialised"}') == '{"already": "serialised"}'
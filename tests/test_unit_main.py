@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.logs.logs_handler import session_id_var
+from app.main import REQUEST_TIMED_OUT_BODY, RequestMiddleware, lifespan
+
+pytestmark = [pytest.mark.unit]
+
+
+async def _call(app, scope):
+    """Runs an ASGI app for a single request and returns the messages it sent."""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+def _http_scope(headers=()):
+    return {"type": "http", "method": "GET", "path": "/", "headers": list(headers)}
+
+
+class TestRequestMiddleware:
+    @pytest.mark.asyncio
+    async def test_handler_running_past_the_timeout_returns_503(self):
+        async def slow_app(scope, receive, send):
+            await asyncio.sleep(1)
+
+        with patch("app.main.REQUEST_TIMEOUT_SECS", 0.01):
+            sent = await _call(RequestMiddleware(slow_app), _http_scope())
+
+        assert sent[0]["type"] == "http.response.start"
+        assert sent[0]["status"] == 503
+        assert sent[1]["body"] == REQUEST_TIMED_OUT_BODY
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_is_not_cut_off_once_started(self):
+        async def streaming_app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            for chunk in (b"first ", b"second"):
+                await asyncio.sleep(0.02)
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        with patch("app.main.REQUEST_TIMEOUT_SECS", 0.01):
+            sent = await _call(RequestMiddleware(streaming_app), _http_scope())
+
+        assert sent[0]["status"] == 200
+        assert b"".join(message.get("body", b"") for message in sent[1:]) == b"first second"
+
+    @pytest.mark.asyncio
+    async def test_session_auth_header_sets_the_session_id(self):
+        seen_session_ids = []
+
+        async def app(scope, receive, send):
+            seen_session_ids.append(session_id_var.get())
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        await _call(RequestMiddleware(app), _http_scope(headers=[(b"session-auth", b"session-123")]))
+
+        assert seen_session_ids == ["session-123"]
+
+    @pytest.mark.asyncio
+    async def test_non_http_scopes_pass_through_unchanged(self):
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append((scope, receive, send))
+
+        scope = {"type": "lifespan"}
+
+        async def receive():
+            return {}
+
+        async def send(message):
+            pass
+
+        await RequestMiddleware(app)(scope, receive, send)
+
+        assert calls == [(scope, receive, send)]
+
+
+class TestLifespan:
+    @pytest.mark.asyncio
+    async def test_shutdown_waits_for_audit_writes_before_closing_the_database(self):
+        shutdown_steps = MagicMock()
+        loop = asyncio.get_running_loop()
+        task_factory = loop.get_task_factory()
+
+        try:
+            with (
+                patch("app.main.verify_connection_to_opensearch"),
+                patch("app.main.SmartTargetsService") as mock_smart_targets,
+                patch("app.main.wait_for_audit_tasks", new_callable=AsyncMock) as mock_wait_for_audit_tasks,
+                patch("app.main.AsyncEngineProvider") as mock_engine_provider,
+                patch("app.main.GovUKHttpSession.close", new_callable=AsyncMock),
+                patch("app.main.GovUKHttpxClient.close", new_callable=AsyncMock),
+            ):
+                mock_smart_targets.return_value.verify_connection = AsyncMock()
+                mock_engine_provider.get.return_value.dispose = AsyncMock()
+                shutdown_steps.attach_mock(mock_wait_for_audit_tasks, "wait_for_audit_tasks")
+                shutdown_steps.attach_mock(mock_engine_provider.get.return_value.dispose, "dispose")
+
+                async with lifespan(MagicMock()):
+                    mock_wait_for_audit_tasks.assert_not_awaited()
+        finally:
+            loop.set_task_factory(task_factory)
+
+        assert [name for name, _, _ in shutdown_steps.mock_calls] == ["wait_for_audit_tasks", "dispose"]